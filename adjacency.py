@@ -0,0 +1,123 @@
+#######################################################
+#### Compressed sparse row adjacency for the grid.
+####
+#### The open neighbors of cell i are
+####     targets[offsets[i]:offsets[i + 1]]
+#### in E, W, S, N order. The graph is derived from the
+#### walls, so it always matches the map it was built from;
+#### patch_csr() keeps it in step when walls change, and
+#### validate() checks a graph against a grid, e.g. one
+#### loaded from a compiled map file.
+#######################################################
+import sys
+from array import array
+
+
+############################################################
+#### Append the open neighbors of one cell to targets
+############################################################
+def add_neighbors(targets, rows, cols, walls, index):
+    if walls[index]:
+        return
+    size = rows * cols
+    y = index % cols
+    if y + 1 < cols and not walls[index + 1]:
+        targets.append(index + 1)
+    if y > 0 and not walls[index - 1]:
+        targets.append(index - 1)
+    if index + cols < size and not walls[index + cols]:
+        targets.append(index + cols)
+    if index >= cols and not walls[index - cols]:
+        targets.append(index - cols)
+
+
+def build_csr(rows, cols, walls):
+    size = rows * cols
+    offsets = array('i', [0]) * (size + 1)
+    targets = array('i')
+    for index in range(size):
+        add_neighbors(targets, rows, cols, walls, index)
+        offsets[index + 1] = len(targets)
+    return offsets, targets
+
+
+############################################################
+#### Rebuild the rows of cells first..last in place after
+#### their walls changed. Only that block of targets is
+#### rewritten; later offsets shift by the size difference.
+############################################################
+def patch_csr(offsets, targets, rows, cols, walls, first, last):
+    block = array('i')
+    block_offsets = []
+    for index in range(first, last + 1):
+        block_offsets.append(len(block))
+        add_neighbors(block, rows, cols, walls, index)
+
+    start = offsets[first]
+    delta = len(block) - (offsets[last + 1] - start)
+    targets[start:offsets[last + 1]] = block
+    for index, offset in enumerate(block_offsets, first):
+        offsets[index] = start + offset
+    if delta:
+        offsets[last + 1:] = array('i', map(delta.__add__, offsets[last + 1:]))
+
+
+############################################################
+#### Problems with a CSR graph for this grid, as messages.
+#### An empty list means the graph is exactly the set of
+#### moves between open 4-adjacent cells.
+############################################################
+def validate(grid, offsets, targets):
+    problems = []
+    size = grid.size
+    if len(offsets) != size + 1:
+        return [f"offsets has {len(offsets)} entries, expected {size + 1}"]
+    if offsets[0] != 0 or offsets[size] != len(targets):
+        problems.append("offsets do not span the targets array")
+
+    edges = set()
+    for index in range(size):
+        start, end = offsets[index], offsets[index + 1]
+        if end < start:
+            problems.append(f"cell {grid.pos(index)}: offsets decrease")
+            continue
+        for target in targets[start:end]:
+            if not 0 <= target < size:
+                problems.append(f"cell {grid.pos(index)}: neighbor index {target} is off the map")
+                continue
+            edges.add((index, target))
+            if target == index:
+                problems.append(f"cell {grid.pos(index)}: links to itself")
+            elif abs(index // grid.cols - target // grid.cols) + abs(index % grid.cols - target % grid.cols) != 1:
+                problems.append(f"cell {grid.pos(index)}: {grid.pos(target)} is not adjacent")
+            elif grid.walls[index] or grid.walls[target]:
+                problems.append(f"cell {grid.pos(index)}: edge to {grid.pos(target)} touches a wall")
+
+    for index, target in edges:
+        if (target, index) not in edges:
+            problems.append(f"cell {grid.pos(index)}: edge to {grid.pos(target)} has no reverse")
+
+    expected_offsets, expected_targets = build_csr(grid.rows, grid.cols, grid.walls)
+    for index in range(size):
+        for target in expected_targets[expected_offsets[index]:expected_offsets[index + 1]]:
+            if (index, target) not in edges:
+                problems.append(f"cell {grid.pos(index)}: missing edge to {grid.pos(target)}")
+    return problems
+
+
+def main(argv=None):
+    from grid import Grid
+    from hospital_map import maze, floor_plan
+    from mapfile import load_map
+
+    argv = sys.argv[1:] if argv is None else argv
+    grid = load_map(argv[0]) if argv else Grid.from_matrices(maze, floor_plan)
+    problems = validate(grid, grid.offsets, grid.targets)
+    for problem in problems:
+        print(problem)
+    print(f"{grid.rows} x {grid.cols} cells, {len(grid.targets)} edges, {len(problems)} problems")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
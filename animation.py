@@ -0,0 +1,123 @@
+#######################################################
+#### Path animation driven by Tk's event loop.
+####
+#### Each frame is one after() callback that advances the
+#### robot a single cell, so the window keeps handling
+#### input between frames. Every path layer keeps a pool of
+#### canvas rectangles: a cell already drawn in a layer is
+#### not drawn again, and playing a new animation reuses the
+#### rectangles of the previous one instead of creating more.
+#######################################################
+
+from tracing import span
+
+DEFAULT_FPS = 10
+
+
+class PathLayer:
+    def __init__(self, renderer, color, tag):
+        self.renderer = renderer
+        self.color = color
+        self.tag = tag
+        self.items = []
+        #### Cell -> item showing it
+        self.shown = {}
+
+    def add(self, cell):
+        if cell in self.shown:
+            return self.shown[cell]
+        if len(self.shown) < len(self.items):
+            item = self.items[len(self.shown)]
+            self.renderer.move_cell(item, cell)
+            self.renderer.canvas.itemconfigure(item, state='normal')
+        else:
+            item = self.renderer.draw_cell(cell, self.color, tags=(self.tag,))
+            self.items.append(item)
+        self.shown[cell] = item
+        return item
+
+    ############################################################
+    #### Hide every cell; the items are kept for reuse
+    ############################################################
+    def clear(self):
+        for item in self.items:
+            self.renderer.canvas.itemconfigure(item, state='hidden')
+        self.shown.clear()
+
+
+class PathAnimator:
+    def __init__(self, root, renderer, fps=DEFAULT_FPS, instant=False):
+        self.root = root
+        self.renderer = renderer
+        self.delay = max(int(1000 / fps), 1)
+        self.instant = instant
+        self.travelled = PathLayer(renderer, 'darkblue', 'travelled')
+        #### The robot's current cell
+        self.head = PathLayer(renderer, 'green', 'head')
+        self.cells = []
+        self.position = 0
+        self.pending = None
+        self.on_done = None
+
+    @property
+    def running(self):
+        return self.pending is not None
+
+    ############################################################
+    #### Animate the legs one after another, then call on_done.
+    #### Each leg is a list of positions starting at the cell
+    #### the robot is on; legs that are None are skipped.
+    ############################################################
+    def play(self, legs, on_done=None):
+        self.cancel()
+        self.travelled.clear()
+        self.head.clear()
+        self.cells = [cell for leg in legs if leg is not None for cell in leg[1:]]
+        self.position = 0
+        self.on_done = on_done
+        if self.instant:
+            self.skip()
+        else:
+            self.pending = self.root.after(self.delay, self.step)
+
+    def step(self):
+        self.pending = None
+        if self.position >= len(self.cells):
+            self.finish()
+            return
+        with span("draw_path_step", cell=self.cells[self.position]):
+            self.advance()
+        self.pending = self.root.after(self.delay, self.step)
+
+    def advance(self):
+        if self.position:
+            self.travelled.add(self.cells[self.position - 1])
+        self.head.clear()
+        self.renderer.canvas.tag_raise(self.head.add(self.cells[self.position]))
+        self.position += 1
+
+    ############################################################
+    #### Jump to the end of the animation at once, starting
+    #### with the cell the robot is on
+    ############################################################
+    def skip(self, event=None):
+        self.cancel()
+        with span("draw_path_skip", cells=len(self.cells) - self.position):
+            for cell in self.cells[max(self.position - 1, 0):]:
+                self.travelled.add(cell)
+        self.position = len(self.cells)
+        self.head.clear()
+        self.finish()
+
+    def cancel(self):
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+
+    def finish(self):
+        if self.position:
+            self.travelled.add(self.cells[self.position - 1])
+        self.head.clear()
+        on_done, self.on_done = self.on_done, None
+        if on_done is not None:
+            on_done()
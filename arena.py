@@ -0,0 +1,60 @@
+#######################################################
+#### Reusable search state with generation stamps.
+####
+#### A cell's g-cost and parent only count when its stamp
+#### matches the current generation, and it is closed when
+#### its closed stamp does. Starting a new search is O(1):
+#### bump the generation instead of sweeping every cell.
+#######################################################
+from array import array
+
+#### g-cost of a cell that has not been reached
+INF = 2 ** 31 - 1
+NO_PARENT = -1
+
+#### Stamps, g-costs and parents are signed 32-bit ('i');
+#### sweep the stamps once they run out
+MAX_GENERATION = 2 ** 31 - 1
+
+
+class SearchArena:
+    def __init__(self, size):
+        self.size = size
+        self.generation = 0
+        self.stamp = array('i', [0]) * size
+        self.closed = array('i', [0]) * size
+        self.g = array('i', [INF]) * size
+        self.parent = array('i', [NO_PARENT]) * size
+
+    ############################################################
+    #### Start a new search and return its generation ID
+    ############################################################
+    def begin(self):
+        if self.generation == MAX_GENERATION:
+            self.stamp[:] = array('i', [0]) * self.size
+            self.closed[:] = array('i', [0]) * self.size
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def reached(self, index):
+        return self.stamp[index] == self.generation
+
+    def cost(self, index):
+        return self.g[index] if self.stamp[index] == self.generation else INF
+
+    def visit(self, index, g, parent):
+        self.stamp[index] = self.generation
+        self.g[index] = g
+        self.parent[index] = parent
+
+    ############################################################
+    #### Cell indexes from the search start to index
+    ############################################################
+    def trace(self, index):
+        path = []
+        while index != NO_PARENT:
+            path.append(index)
+            index = self.parent[index]
+        path.reverse()
+        return path
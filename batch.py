@@ -0,0 +1,97 @@
+#######################################################
+#### Process-pool batch runner for delivery job files.
+####
+#### Each worker builds the solver once and then solves
+#### every job file it is handed. One JSON record per job
+#### is written to the output, in input order or as soon
+#### as each job finishes.
+#######################################################
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from solver import ROUTES, load_solver
+
+#### Solver owned by the current worker process
+_solver = None
+_route = "greedy"
+
+
+def init_worker(map_path, cache_dir, route):
+    global _solver, _route
+    _solver = load_solver(map_path, cache_dir)
+    _route = route
+
+
+############################################################
+#### Solve one job file and return its result record
+############################################################
+def run_job(file_path):
+    started = time.perf_counter()
+    try:
+        record = _solver.solve_file(file_path, _route).to_dict()
+    except (OSError, ValueError) as error:
+        record = {"success": False, "error": str(error)}
+    record["file"] = file_path
+    record["wall_time"] = time.perf_counter() - started
+    return record
+
+
+def run_batch(file_paths, workers=None, chunksize=1, ordered=True, map_path=None, cache_dir=None,
+              route="greedy"):
+    with multiprocessing.Pool(workers, init_worker, (map_path, cache_dir, route)) as pool:
+        results = pool.imap if ordered else pool.imap_unordered
+        yield from results(run_job, file_paths, chunksize)
+
+
+def read_file_list(list_path):
+    with open(list_path, 'r') as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many delivery job files on a process pool.")
+    parser.add_argument("input_files", nargs="*", help="delivery job files")
+    parser.add_argument("--file-list", metavar="FILE", help="read more job file paths from FILE, one per line")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunksize", type=int, default=16, help="jobs handed to a worker at a time (default: 16)")
+    parser.add_argument("--unordered", action="store_true", help="write results as they finish, not in input order")
+    parser.add_argument("-o", "--output", help="JSON lines file for the results (default: stdout)")
+    parser.add_argument("--map", metavar="FILE", help="compiled map file (default: the bundled hospital map)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="save distance fields for frequent destinations under DIR")
+    parser.add_argument("--route", choices=ROUTES, default="greedy",
+                        help="how to order the delivery locations (default: greedy)")
+    args = parser.parse_args(argv)
+
+    file_paths = list(args.input_files)
+    if args.file_list:
+        file_paths += read_file_list(args.file_list)
+    if not file_paths:
+        parser.error("no job files given")
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    failures = 0
+    started = time.perf_counter()
+    try:
+        for record in run_batch(file_paths, args.workers, args.chunksize, not args.unordered,
+                                args.map, args.cache_dir, args.route):
+            output.write(json.dumps(record) + "\n")
+            if not record["success"]:
+                failures += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"{len(file_paths)} jobs, {failures} failed, {elapsed:.2f} s "
+          f"({len(file_paths) / elapsed:.1f} jobs/s)", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
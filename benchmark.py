@@ -0,0 +1,252 @@
+#######################################################
+#### Benchmark suite for the delivery solver.
+####
+#### Runs the solver on the bundled hospital map with the
+#### sample input*.txt jobs, and on synthetic maps from
+#### 30 x 30 up to 2000 x 2000 with a growing number of
+#### delivery locations. The synthetic maps are generated
+#### floor plans (map_generator.py) or, with --layout random,
+#### scattered obstacles. Every case records wall time,
+#### expanded cells and peak traced memory, both of the
+#### solve and of building the grid, its CSR graph and its
+#### search arena. The results go to a JSON file that a
+#### later run can be compared with:
+####
+####     python benchmark.py -o before.json
+####     python benchmark.py -o after.json --compare before.json
+#######################################################
+import argparse
+import gc
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from grid import Grid
+from hospital_map import WARD_PRIORITY
+from map_generator import generate_grid
+from solver import ROUTES, DeliverySolver, load_solver, parse_input_file
+
+SIZES = (30, 100, 250, 500, 1000, 2000)
+GOAL_COUNTS = (1, 4, 16)
+ALGORITHMS = ("astar", "dijkstra")
+
+#### Share of wall cells and side of a ward block on synthetic grids
+WALL_DENSITY = 0.2
+WARD_BLOCK = 25
+
+
+############################################################
+#### Random obstacles over square ward blocks. The same
+#### seed always gives the same grid.
+############################################################
+def random_grid(rows, cols, seed=0, wall_density=WALL_DENSITY):
+    rng = random.Random(seed)
+    size = rows * cols
+    threshold = int(256 * wall_density)
+    walls = bytearray(rng.randbytes(size).translate(bytes([1] * threshold + [0] * (256 - threshold))))
+
+    letters = [ord(ward) for ward in WARD_PRIORITY] + [ord('0')]
+    wards = bytearray()
+    for x in range(rows):
+        if x % WARD_BLOCK == 0:
+            block_rng = random.Random(f"{seed}:{x // WARD_BLOCK}")
+            blocks = [block_rng.choice(letters) for _ in range(cols // WARD_BLOCK + 1)]
+            row = bytes(blocks[y // WARD_BLOCK] for y in range(cols))
+        wards += row
+    return Grid(rows, cols, walls, wards)
+
+
+############################################################
+#### A start and goals on distinct open cells
+############################################################
+def random_job(grid, goals, seed=0):
+    rng = random.Random(seed)
+    chosen = []
+    while len(chosen) < goals + 1:
+        index = rng.randrange(grid.size)
+        if not grid.walls[index] and index not in chosen:
+            chosen.append(index)
+    positions = grid.positions(chosen)
+    return positions[0], positions[1:]
+
+
+############################################################
+#### Run build() under tracemalloc. Returns its result, the
+#### memory the result still holds and the peak during build.
+############################################################
+def traced_build(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+############################################################
+#### Solve one job: the fastest of several timed runs, then
+#### one more run under tracemalloc for the memory peak. The
+#### solvers have no path cache, so every run searches.
+############################################################
+def measure(solver, alg, start, goals, repeat, route):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = solver.solve(alg, start, goals, route)
+        times.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        solver.solve(alg, start, goals, route)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "alg": alg,
+        "route": route,
+        "goals": len(goals),
+        "delivered": len(result.success_goals),
+        "moves": result.moves,
+        "expanded": result.expanded,
+        "weighted_completion": result.weighted_completion,
+        "wall_time": min(times),
+        "wall_time_median": statistics.median(times),
+        "repeat": repeat,
+        "peak_memory": peak,
+    }
+
+
+def bundled_cases(algorithms, repeat, route, job_glob):
+    solver, build_memory, build_peak = traced_build(lambda: load_solver(path_cache_size=0))
+    for file_path in sorted(glob.glob(job_glob)):
+        try:
+            alg, start, goals = parse_input_file(file_path)
+        except (OSError, ValueError) as error:
+            print(f"{file_path}: skipped, {error}", file=sys.stderr)
+            continue
+        for alg in algorithms:
+            record = measure(solver, alg, start, goals, repeat, route)
+            record.update(map="hospital", rows=solver.rows, cols=solver.cols, job=os.path.basename(file_path),
+                          build_memory=build_memory, build_peak_memory=build_peak)
+            yield record
+
+
+#### Synthetic map builders by --layout
+LAYOUTS = {
+    "hospital": generate_grid,
+    "random": random_grid,
+}
+
+
+def synthetic_cases(sizes, goal_counts, algorithms, repeat, route, seed, layout="hospital"):
+    for size in sizes:
+        started = time.perf_counter()
+        grid = LAYOUTS[layout](size, size, seed)
+        solver = DeliverySolver.from_grid(grid, path_cache_size=0)
+        build_time = time.perf_counter() - started
+        #### Tracing the generator itself would mostly measure its
+        #### scratch objects and slow it down many times over, so
+        #### the grid is traced as it is built again from its walls
+        #### and wards
+        _, build_memory, build_peak = traced_build(lambda: DeliverySolver.from_grid(
+            Grid(size, size, bytearray(grid.walls), bytearray(grid.wards)), path_cache_size=0))
+        for goals in goal_counts:
+            start, goal_list = random_job(grid, goals, seed + goals)
+            for alg in algorithms:
+                record = measure(solver, alg, start, goal_list, repeat, route)
+                record.update(map=f"synthetic-{layout}", rows=size, cols=size, job=f"seed {seed + goals}",
+                              build_time=build_time, build_memory=build_memory, build_peak_memory=build_peak)
+                yield record
+
+
+def case_key(record):
+    return (record["map"], record["rows"], record["cols"], record["job"], record["alg"], record["route"],
+            record["goals"])
+
+
+############################################################
+#### Wall time of each case relative to an earlier run
+############################################################
+def compare(records, baseline_path):
+    with open(baseline_path, 'r') as file:
+        baseline = {case_key(record): record for record in json.load(file)["results"]}
+    for record in records:
+        before = baseline.get(case_key(record))
+        if before is None or not before["wall_time"]:
+            continue
+        ratio = record["wall_time"] / before["wall_time"]
+        line = f"{describe(record)}: {before['wall_time'] * 1000:.2f} ms -> {record['wall_time'] * 1000:.2f} ms " \
+               f"({ratio:.2f}x), expanded {before['expanded']} -> {record['expanded']}"
+        if "build_memory" in before:
+            line += f", build memory {before['build_memory'] / 1024:.1f} -> {record['build_memory'] / 1024:.1f} KiB"
+        print(line)
+
+
+def describe(record):
+    return f"{record['map']} {record['rows']}x{record['cols']} {record['job']} {record['alg']} " \
+           f"{record['goals']} goals"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the delivery solver.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(SIZES),
+                        help="sides of the synthetic square grids (default: %(default)s)")
+    parser.add_argument("--goals", type=int, nargs="+", default=list(GOAL_COUNTS),
+                        help="delivery locations per synthetic job (default: %(default)s)")
+    parser.add_argument("--algs", nargs="+", default=list(ALGORITHMS),
+                        help="delivery algorithms to run (default: %(default)s)")
+    parser.add_argument("--route", choices=ROUTES, default="greedy",
+                        help="how to order the delivery locations (default: greedy)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic grids and jobs")
+    parser.add_argument("--layout", choices=tuple(LAYOUTS), default="hospital",
+                        help="synthetic maps: generated floor plans or random obstacles (default: hospital)")
+    parser.add_argument("--jobs", default="input*.txt", metavar="GLOB",
+                        help="job files for the bundled map (default: input*.txt)")
+    parser.add_argument("-o", "--output", help="JSON file for the results (default: stdout)")
+    parser.add_argument("--compare", metavar="FILE", help="print wall time changes against an earlier result file")
+    args = parser.parse_args(argv)
+
+    records = []
+    cases = [bundled_cases(args.algs, args.repeat, args.route, args.jobs),
+             synthetic_cases(args.sizes, args.goals, args.algs, args.repeat, args.route, args.seed,
+                             args.layout)]
+    for group in cases:
+        for record in group:
+            print(f"{describe(record)}: {record['wall_time'] * 1000:.2f} ms, {record['expanded']} expanded, "
+                  f"{record['peak_memory'] / 1024:.1f} KiB peak, {record['build_memory'] / 1024:.1f} KiB grid",
+                  file=sys.stderr)
+            records.append(record)
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": records,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+
+    if args.compare:
+        compare(records, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#######################################################
+#### Long-running solver daemon.
+####
+#### Keeps one warm solver in memory and answers delivery
+#### jobs over a Unix socket or a localhost TCP port. Every
+#### connection may send any number of requests, one JSON
+#### object per line, and gets one JSON line back for each:
+####
+####     {"job": "Delivery algorithm: astar\nStart location: ..."}
+####     {"alg": "astar", "start": [3, 5], "goals": [[16, 5], [20, 15]]}
+####
+#### Both forms accept an optional "route" of "greedy",
+#### "optimized" or "weighted". {"path_cache": true}
+#### returns the hit, miss and eviction counters of the
+#### solver's path cache. A request that cannot be served
+#### gets {"success": false, "error": ...} back. Connections
+#### are served on their own threads; searches share one
+#### solver under a lock.
+#######################################################
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+
+from solver import ALGORITHMS, ROUTES, load_solver, parse_job
+
+
+############################################################
+#### A cell from a request: a list of two integers
+############################################################
+def position(value, field):
+    if not isinstance(value, list) or len(value) != 2 or \
+            not all(isinstance(number, int) and not isinstance(number, bool) for number in value):
+        raise ValueError(f"{field} must be a pair of integers, got {json.dumps(value)}")
+    return tuple(value)
+
+
+class SolverService:
+    def __init__(self, map_path=None, cache_dir=None):
+        self.solver = load_solver(map_path, cache_dir)
+        self.lock = threading.Lock()
+
+    ############################################################
+    #### Answer one decoded request with a JSON-ready dict
+    ############################################################
+    def handle(self, request):
+        if not isinstance(request, dict):
+            raise ValueError("A request must be a JSON object")
+        if request.get("path_cache"):
+            with self.lock:
+                cache = self.solver.path_cache
+                return cache.to_dict() if cache is not None else {"entries": 0}
+
+        if "job" in request:
+            if not isinstance(request["job"], str):
+                raise ValueError("job must be the text of a job file")
+            alg, start, goals = parse_job(request["job"])
+        else:
+            alg = request.get("alg", "astar")
+            if alg not in ALGORITHMS:
+                raise ValueError(f"Unknown delivery algorithm: {alg}")
+            start = position(request["start"], "start")
+            if not isinstance(request["goals"], list):
+                raise ValueError("goals must be a list of pairs of integers")
+            goals = [position(goal, "goal") for goal in request["goals"]]
+
+        route = request.get("route", "greedy")
+        if route not in ROUTES:
+            raise ValueError(f"Unknown route planner: {route}")
+
+        with self.lock:
+            return self.solver.solve(alg, start, goals, route).to_dict()
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = self.server.service.handle(json.loads(line))
+            except KeyError as error:
+                reply = {"success": False, "error": f"Missing field: {error.args[0]}"}
+            except (TypeError, ValueError) as error:
+                reply = {"success": False, "error": str(error)}
+            except Exception as error:
+                #### A failed request must not take the connection down
+                reply = {"success": False, "error": f"{type(error).__name__}: {error}"}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+class TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service, host="127.0.0.1", port=8765, socket_path=None):
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixServer(socket_path, RequestHandler)
+    else:
+        server = TCPServer((host, port), RequestHandler)
+    server.service = service
+    return server
+
+
+############################################################
+#### Small client: send one request, wait for its reply
+############################################################
+def request(payload, host="127.0.0.1", port=8765, socket_path=None):
+    if socket_path:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socket_path)
+    else:
+        connection = socket.create_connection((host, port))
+    with connection, connection.makefile('rwb') as stream:
+        stream.write(json.dumps(payload).encode() + b"\n")
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve delivery jobs from a warm solver.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--socket", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--map", metavar="FILE", help="compiled map file (default: the bundled hospital map)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="save distance fields for frequent destinations under DIR")
+    args = parser.parse_args(argv)
+
+    server = make_server(SolverService(args.map, args.cache_dir), args.host, args.port, args.socket)
+    print(f"Solver listening on {args.socket or f'{args.host}:{args.port}'}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
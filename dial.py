@@ -0,0 +1,144 @@
+#######################################################
+#### Bucket-queue search for small integer move costs.
+####
+#### With every move costing 1, Dijkstra's heap only ever
+#### holds two distinct keys, so a FIFO queue settles cells
+#### in the same order at O(1) per operation: the search is
+#### a breadth-first search that stops at the goal. For
+#### moves costing 1..max_cost, Dial's algorithm keeps
+#### max_cost + 1 buckets in a ring, indexed by distance,
+#### which is the same frontier with more than one slot.
+#######################################################
+from collections import deque
+
+from arena import NO_PARENT
+
+
+class BucketQueue:
+    def __init__(self, max_cost):
+        #### Keys in the queue never differ by more than max_cost
+        self.buckets = [deque() for _ in range(max_cost + 1)]
+        self.current = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, item):
+        self.buckets[key % len(self.buckets)].append(item)
+        self.size += 1
+
+    ############################################################
+    #### (key, item) with the smallest key, oldest first
+    ############################################################
+    def pop(self):
+        buckets = self.buckets
+        while not buckets[self.current % len(buckets)]:
+            self.current += 1
+        self.size -= 1
+        return self.current, buckets[self.current % len(buckets)].popleft()
+
+
+############################################################
+#### Dijkstra for unit or small integer move costs. Same
+#### signature as engines.astar; the heuristic is ignored.
+#### cost(a, b), if given, returns the cost of moving from
+#### cell a to its neighbor b, between 1 and max_cost.
+############################################################
+def dial_search(grid, start, goal, heuristic=None, stats=None, cost=None, max_cost=1):
+    if cost is None:
+        return breadth_first(grid, start, goal, stats)
+
+    arena = grid.arena
+    generation = arena.begin()
+    stamp = arena.stamp
+    g = arena.g
+    parent = arena.parent
+    closed = arena.closed
+    offsets = grid.offsets
+    targets = grid.targets
+
+    arena.visit(start, 0, NO_PARENT)
+    frontier = BucketQueue(max_cost)
+    frontier.push(0, start)
+    expanded = 0
+    pushes = 1
+    stale = 0
+    peak = 1
+
+    while frontier:
+        if len(frontier) > peak:
+            peak = len(frontier)
+        distance, current = frontier.pop()
+        if closed[current] == generation or distance != g[current]:
+            stale += 1
+            continue
+        closed[current] = generation
+        if current == goal:
+            if stats is not None:
+                stats.count(expanded, pushes, stale, peak)
+            return arena.trace(goal), expanded
+        expanded += 1
+
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if closed[neighbor] == generation:
+                continue
+            new_g = distance + cost(current, neighbor)
+            if stamp[neighbor] != generation or new_g < g[neighbor]:
+                stamp[neighbor] = generation
+                g[neighbor] = new_g
+                parent[neighbor] = current
+                frontier.push(new_g, neighbor)
+                pushes += 1
+
+    if stats is not None:
+        stats.count(expanded, pushes, stale, peak)
+    return None, expanded
+
+
+############################################################
+#### Unit costs: one FIFO queue. A cell's first discovery is
+#### already along a shortest path, so nothing goes stale
+#### and the goal can be returned as soon as it is reached.
+############################################################
+def breadth_first(grid, start, goal, stats=None):
+    arena = grid.arena
+    generation = arena.begin()
+    stamp = arena.stamp
+    g = arena.g
+    parent = arena.parent
+    offsets = grid.offsets
+    targets = grid.targets
+
+    arena.visit(start, 0, NO_PARENT)
+    if start == goal:
+        if stats is not None:
+            stats.count(0, 1, 0, 1)
+        return [start], 0
+    frontier = deque([start])
+    expanded = 0
+    pushes = 1
+    peak = 1
+
+    while frontier:
+        if len(frontier) > peak:
+            peak = len(frontier)
+        current = frontier.popleft()
+        expanded += 1
+        new_g = g[current] + 1
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if stamp[neighbor] == generation:
+                continue
+            stamp[neighbor] = generation
+            g[neighbor] = new_g
+            parent[neighbor] = current
+            if neighbor == goal:
+                if stats is not None:
+                    stats.count(expanded, pushes + 1, 0, peak)
+                return arena.trace(goal), expanded
+            frontier.append(neighbor)
+            pushes += 1
+
+    if stats is not None:
+        stats.count(expanded, pushes, 0, peak)
+    return None, expanded
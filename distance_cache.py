@@ -0,0 +1,144 @@
+#######################################################
+#### Persistent distance-to-goal fields.
+####
+#### A distance field holds the number of moves from every
+#### cell to one destination. Once a destination has been
+#### asked for often enough its field is computed with a
+#### breadth-first search and saved under a directory named
+#### after a hash of the walls and wards, so a changed map
+#### never reads fields built for the old one. A path from
+#### any start is then a walk down the gradient.
+#######################################################
+import hashlib
+import os
+import tempfile
+from array import array
+from collections import deque
+
+from arena import INF
+
+
+############################################################
+#### Hash of the map the fields were computed on
+############################################################
+def map_hash(grid):
+    digest = hashlib.sha256()
+    digest.update(f"{grid.rows}x{grid.cols}".encode())
+    digest.update(bytes(grid.walls))
+    digest.update(bytes(grid.wards))
+    return digest.hexdigest()[:16]
+
+
+############################################################
+#### Moves from every cell to goal, INF where unreachable
+############################################################
+def distance_field(grid, goal):
+    field = array('i', [INF]) * grid.size
+    field[goal] = 0
+    frontier = deque([goal])
+    offsets = grid.offsets
+    targets = grid.targets
+    while frontier:
+        current = frontier.popleft()
+        distance = field[current] + 1
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if field[neighbor] == INF:
+                field[neighbor] = distance
+                frontier.append(neighbor)
+    return field
+
+
+############################################################
+#### Walk from start to the field's goal, always stepping to
+#### the first neighbor that is one move closer.
+#### Returns the cell indexes, or None when unreachable.
+############################################################
+def follow_gradient(grid, field, start):
+    if field[start] == INF:
+        return None
+    path = [start]
+    current = start
+    while field[current] > 0:
+        closer = field[current] - 1
+        for neighbor in grid.neighbors(current):
+            if field[neighbor] == closer:
+                current = neighbor
+                break
+        path.append(current)
+    return path
+
+
+class DistanceCache:
+    def __init__(self, grid, directory=".distance_cache", min_requests=2):
+        self.grid = grid
+        #### Destinations asked for this many times get a field
+        self.min_requests = min_requests
+        self.root = directory
+        self.version = None
+        self.refresh()
+
+    ############################################################
+    #### Forget fields from before the last wall edit
+    ############################################################
+    def refresh(self):
+        if self.version != self.grid.version:
+            self.version = self.grid.version
+            self.directory = os.path.join(self.root, map_hash(self.grid))
+            self.fields = {}
+            self.requests = {}
+
+    def path_for(self, goal):
+        return os.path.join(self.directory, f"{goal}.field")
+
+    ############################################################
+    #### Field for goal if it is cached or has become frequent,
+    #### otherwise None so the caller runs a normal search
+    ############################################################
+    def field(self, goal):
+        self.refresh()
+        field = self.fields.get(goal)
+        if field is not None:
+            return field
+
+        field = self.load(goal)
+        if field is None:
+            self.requests[goal] = self.requests.get(goal, 0) + 1
+            if self.requests[goal] < self.min_requests:
+                return None
+            field = distance_field(self.grid, goal)
+            self.save(goal, field)
+
+        self.fields[goal] = field
+        return field
+
+    def precompute(self, goals):
+        self.refresh()
+        for goal in goals:
+            if goal not in self.fields:
+                self.fields[goal] = self.load(goal) or self.save(goal, distance_field(self.grid, goal))
+
+    def load(self, goal):
+        try:
+            with open(self.path_for(goal), 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        field = array('i')
+        #### A truncated or foreign file is ignored and rebuilt
+        if len(data) != self.grid.size * field.itemsize:
+            return None
+        field.frombytes(data)
+        return field
+
+    ############################################################
+    #### Write through a temporary file so readers in other
+    #### processes never see a half-written field
+    ############################################################
+    def save(self, goal, field):
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, 'wb') as file:
+            file.write(field.tobytes())
+        os.replace(temp_path, self.path_for(goal))
+        return field
@@ -0,0 +1,142 @@
+#######################################################
+#### D* Lite incremental replanning.
+####
+#### The search runs backwards from the goal, so when walls
+#### change under a robot that is already moving, only the
+#### cells whose cost-to-goal actually changed are
+#### re-expanded, and the work done for earlier plans is
+#### kept. Use it with Grid.set_wall:
+####
+####     planner = DStarLite(grid, start, goal)
+####     path = planner.plan()
+####     planner.move_to(path[3])
+####     grid.set_wall((14, 5))
+####     planner.cells_changed([(14, 5)])
+####     path = planner.plan()
+#######################################################
+from heapq import heappush, heappop
+
+from arena import INF
+
+
+class DStarLite:
+    def __init__(self, grid, start, goal):
+        self.grid = grid
+        self.start = grid.index(start)
+        self.goal = grid.index(goal)
+        #### Key offset that keeps old queue keys valid after moves
+        self.km = 0
+        self.g = {}
+        self.rhs = {self.goal: 0}
+        #### Cell -> its current key; heap entries with another key are stale
+        self.queued = {}
+        self.open_list = []
+        #### Cells expanded by the last plan() and over the whole run
+        self.expanded = 0
+        self.total_expanded = 0
+        self.push(self.goal, self.key(self.goal))
+
+    def heuristic(self, a, b):
+        cols = self.grid.cols
+        return abs(a // cols - b // cols) + abs(a % cols - b % cols)
+
+    def key(self, cell):
+        best = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (best + self.heuristic(self.start, cell) + self.km, best)
+
+    def push(self, cell, key):
+        self.queued[cell] = key
+        heappush(self.open_list, (key, cell))
+
+    def top_key(self):
+        while self.open_list:
+            key, cell = self.open_list[0]
+            if self.queued.get(cell) == key:
+                return key
+            heappop(self.open_list)
+        return (INF, INF)
+
+    ############################################################
+    #### Recompute rhs of a cell from its successors and queue
+    #### it if it became inconsistent
+    ############################################################
+    def update_cell(self, cell):
+        if cell != self.goal:
+            best = INF
+            if not self.grid.walls[cell]:
+                for neighbor in self.grid.neighbors(cell):
+                    best = min(best, self.g.get(neighbor, INF) + 1)
+            self.rhs[cell] = best
+        self.queued.pop(cell, None)
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self.push(cell, self.key(cell))
+
+    def compute_shortest_path(self):
+        expanded = 0
+        while True:
+            top = self.top_key()
+            start_rhs = self.rhs.get(self.start, INF)
+            if top >= self.key(self.start) and start_rhs == self.g.get(self.start, INF):
+                break
+            if top == (INF, INF):
+                break
+
+            cell = heappop(self.open_list)[1]
+            del self.queued[cell]
+            new_key = self.key(cell)
+            if top < new_key:
+                self.push(cell, new_key)
+                continue
+
+            expanded += 1
+            if self.g.get(cell, INF) > self.rhs.get(cell, INF):
+                self.g[cell] = self.rhs[cell]
+                for neighbor in self.grid.neighbors(cell):
+                    self.update_cell(neighbor)
+            else:
+                self.g[cell] = INF
+                self.update_cell(cell)
+                for neighbor in self.grid.neighbors(cell):
+                    self.update_cell(neighbor)
+        return expanded
+
+    ############################################################
+    #### Shortest path from the current start to the goal as
+    #### positions, or None when the goal is cut off
+    ############################################################
+    def plan(self):
+        self.expanded = self.compute_shortest_path()
+        self.total_expanded += self.expanded
+        if self.g.get(self.start, INF) == INF:
+            return None
+
+        path = [self.start]
+        current = self.start
+        while current != self.goal and len(path) <= self.grid.size:
+            current = min(self.grid.neighbors(current), key=lambda cell: self.g.get(cell, INF))
+            path.append(current)
+        return self.grid.positions(path)
+
+    ############################################################
+    #### The robot moved; later keys are offset instead of
+    #### re-keying the whole queue
+    ############################################################
+    def move_to(self, pos):
+        cell = self.grid.index(pos)
+        self.km += self.heuristic(self.start, cell)
+        self.start = cell
+
+    ############################################################
+    #### Walls changed at these positions (already applied to
+    #### the grid); repair the costs around them
+    ############################################################
+    def cells_changed(self, positions):
+        grid = self.grid
+        cols = grid.cols
+        for pos in positions:
+            cell = grid.index(pos)
+            self.update_cell(cell)
+            x, y = pos
+            for nx, ny in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)):
+                if grid.in_bounds((nx, ny)):
+                    self.update_cell(nx * cols + ny)
@@ -0,0 +1,315 @@
+#######################################################
+#### Search engines over a Grid.
+####
+#### Every engine takes the grid, a start and a goal cell
+#### index, and returns (path, expanded): the list of cell
+#### indexes from start to goal (None when unreachable)
+#### and the number of cells it expanded. Given a
+#### stats.SearchStats as stats=, an engine also records its
+#### heap pushes, stale pops and peak open-list size there.
+#######################################################
+from heapq import heappush, heappop
+
+from arena import INF, NO_PARENT
+
+
+############################################################
+#### Manhattan distance to goal, as a function of a cell index
+############################################################
+def manhattan(grid, goal):
+    cols = grid.cols
+    goal_x, goal_y = divmod(goal, cols)
+
+    def heuristic(index):
+        x, y = divmod(index, cols)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    return heuristic
+
+
+############################################################
+#### A* with a binary heap open list and a closed set.
+#### heuristic=None gives Dijkstra. Entries that were
+#### improved or settled after being pushed are skipped when
+#### popped. Ties on f prefer the smaller h, then the
+#### smaller cell index, so runs are repeatable.
+############################################################
+def astar(grid, start, goal, heuristic=None, stats=None):
+    arena = grid.arena
+    generation = arena.begin()
+    stamp = arena.stamp
+    g = arena.g
+    parent = arena.parent
+    closed = arena.closed
+    offsets = grid.offsets
+    targets = grid.targets
+
+    arena.visit(start, 0, NO_PARENT)
+    h = heuristic(start) if heuristic else 0
+    open_list = [(h, h, start)]
+    expanded = 0
+    pushes = 1
+    stale = 0
+    peak = 1
+
+    while open_list:
+        if len(open_list) > peak:
+            peak = len(open_list)
+        f, h, current = heappop(open_list)
+
+        #### Stale entry: the cell was already settled
+        if closed[current] == generation:
+            stale += 1
+            continue
+        closed[current] = generation
+
+        #### Stop if goal is reached
+        if current == goal:
+            if stats is not None:
+                stats.count(expanded, pushes, stale, peak)
+            return arena.trace(goal), expanded
+        expanded += 1
+
+        #### The cost of moving to a new position is 1 unit
+        new_g = g[current] + 1
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if closed[neighbor] == generation:
+                continue
+            if stamp[neighbor] != generation or new_g < g[neighbor]:
+                stamp[neighbor] = generation
+                g[neighbor] = new_g
+                parent[neighbor] = current
+                h = heuristic(neighbor) if heuristic else 0
+                heappush(open_list, (new_g + h, h, neighbor))
+                pushes += 1
+
+    if stats is not None:
+        stats.count(expanded, pushes, stale, peak)
+    return None, expanded
+
+
+############################################################
+#### Jump Point Search for a 4-connected uniform-cost grid.
+####
+#### Paths are canonical when they turn from vertical to
+#### horizontal only where they must: where the side of the
+#### previous cell was blocked but the side of this cell is
+#### open. A horizontal scan stops at a cell whose vertical
+#### scans find a jump point, so only cells where the path
+#### can turn are pushed on the open list. expanded counts
+#### those jump points. The returned path is filled in cell
+#### by cell between them.
+############################################################
+def jump_point_search(grid, start, goal, heuristic=None, stats=None):
+    rows = grid.rows
+    cols = grid.cols
+    walls = grid.walls
+    #### The scans below would leave a wall cell like any other
+    if walls[start]:
+        if stats is not None:
+            stats.count(0, 0, 0, 0)
+        return None, 0
+    goal_x, goal_y = divmod(goal, cols)
+    if heuristic is None:
+        heuristic = manhattan(grid, goal)
+
+    def is_open(x, y):
+        return 0 <= x < rows and 0 <= y < cols and not walls[x * cols + y]
+
+    def jump_vertical(x, y, dx):
+        while True:
+            previous = x
+            x += dx
+            if not is_open(x, y):
+                return None
+            if x == goal_x and y == goal_y:
+                return x
+            for dy in (1, -1):
+                if is_open(x, y + dy) and not is_open(previous, y + dy):
+                    return x
+
+    def jump_horizontal(x, y, dy):
+        while True:
+            y += dy
+            if not is_open(x, y):
+                return None
+            if x == goal_x and y == goal_y:
+                return y
+            if jump_vertical(x, y, 1) is not None or jump_vertical(x, y, -1) is not None:
+                return y
+
+    arena = grid.arena
+    generation = arena.begin()
+    stamp = arena.stamp
+    g = arena.g
+    parent = arena.parent
+    closed = arena.closed
+
+    #### Direction each jump point was reached from, (0, 0) for the start
+    arrival = {start: (0, 0)}
+    arena.visit(start, 0, NO_PARENT)
+    h = heuristic(start)
+    open_list = [(h, h, start)]
+    expanded = 0
+    pushes = 1
+    stale = 0
+    peak = 1
+
+    while open_list:
+        if len(open_list) > peak:
+            peak = len(open_list)
+        f, h, current = heappop(open_list)
+        if closed[current] == generation:
+            stale += 1
+            continue
+        closed[current] = generation
+
+        if current == goal:
+            if stats is not None:
+                stats.count(expanded, pushes, stale, peak)
+            return fill_path(grid, arena.trace(goal)), expanded
+        expanded += 1
+
+        x, y = divmod(current, cols)
+        dx, dy = arrival[current]
+        if dx:
+            directions = ((dx, 0), (0, 1), (0, -1))
+        elif dy:
+            directions = ((0, dy), (1, 0), (-1, 0))
+        else:
+            directions = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+        for step_x, step_y in directions:
+            if step_x:
+                jump_x = jump_vertical(x, y, step_x)
+                if jump_x is None:
+                    continue
+                jump = jump_x * cols + y
+                distance = abs(jump_x - x)
+            else:
+                jump_y = jump_horizontal(x, y, step_y)
+                if jump_y is None:
+                    continue
+                jump = x * cols + jump_y
+                distance = abs(jump_y - y)
+
+            if closed[jump] == generation:
+                continue
+            new_g = g[current] + distance
+            if stamp[jump] != generation or new_g < g[jump]:
+                stamp[jump] = generation
+                g[jump] = new_g
+                parent[jump] = current
+                arrival[jump] = (step_x, step_y)
+                h = heuristic(jump)
+                heappush(open_list, (new_g + h, h, jump))
+                pushes += 1
+
+    if stats is not None:
+        stats.count(expanded, pushes, stale, peak)
+    return None, expanded
+
+
+############################################################
+#### Expand straight segments between jump points into cells
+############################################################
+def fill_path(grid, jump_points):
+    path = [jump_points[0]]
+    for target in jump_points[1:]:
+        current = path[-1]
+        if current // grid.cols == target // grid.cols:
+            step = 1 if target > current else -1
+        else:
+            step = grid.cols if target > current else -grid.cols
+        while current != target:
+            current += step
+            path.append(current)
+    return path
+
+
+############################################################
+#### Bidirectional A* / Dijkstra.
+####
+#### One search grows from the start in grid.arena and one
+#### from the goal in grid.backward_arena. With a heuristic
+#### both sides use the average potential
+####     p(v) = (h_goal(v) - h_start(v)) / 2
+#### which stays consistent in both directions; keys are
+#### doubled to keep them integers. The best meeting cost mu
+#### is optimal once the two smallest keys add up to 2 * mu.
+#### heuristic=None gives bidirectional Dijkstra.
+############################################################
+def bidirectional(grid, start, goal, heuristic=None, stats=None):
+    if start == goal:
+        if stats is not None:
+            stats.count(0, 0, 0, 0)
+        return [start], 0
+
+    if heuristic is None:
+        def potential(index):
+            return 0
+    else:
+        to_start = manhattan(grid, start)
+
+        def potential(index):
+            return heuristic(index) - to_start(index)
+
+    offsets = grid.offsets
+    targets = grid.targets
+    sides = []
+    for arena, origin, sign in ((grid.arena, start, 1), (grid.backward_arena, goal, -1)):
+        generation = arena.begin()
+        arena.visit(origin, 0, NO_PARENT)
+        key = sign * potential(origin)
+        sides.append([arena, generation, [(key, origin)], sign])
+
+    best = INF
+    meeting = None
+    expanded = 0
+    pushes = 2
+    stale = 0
+    #### Peak of both open lists together
+    peak = 2
+
+    while sides[0][2] and sides[1][2]:
+        if sides[0][2][0][0] + sides[1][2][0][0] >= 2 * best:
+            break
+        if len(sides[0][2]) + len(sides[1][2]) > peak:
+            peak = len(sides[0][2]) + len(sides[1][2])
+
+        #### Expand the side whose frontier is smaller
+        side, other = (sides[0], sides[1]) if len(sides[0][2]) <= len(sides[1][2]) else (sides[1], sides[0])
+        arena, generation, open_list, sign = side
+        other_arena, other_generation = other[0], other[1]
+
+        key, current = heappop(open_list)
+        if arena.closed[current] == generation:
+            stale += 1
+            continue
+        arena.closed[current] = generation
+        expanded += 1
+
+        new_g = arena.g[current] + 1
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if arena.closed[neighbor] == generation:
+                continue
+            if arena.stamp[neighbor] != generation or new_g < arena.g[neighbor]:
+                arena.visit(neighbor, new_g, current)
+                heappush(open_list, (2 * new_g + sign * potential(neighbor), neighbor))
+                pushes += 1
+
+            #### Path through the edge current -> neighbor
+            if other_arena.stamp[neighbor] == other_generation:
+                total = new_g + other_arena.g[neighbor]
+                if total < best:
+                    best = total
+                    meeting = (current, neighbor) if sign == 1 else (neighbor, current)
+
+    if stats is not None:
+        stats.count(expanded, pushes, stale, peak)
+    if meeting is None:
+        return None, expanded
+    forward = grid.arena.trace(meeting[0])
+    backward = grid.backward_arena.trace(meeting[1])
+    backward.reverse()
+    return forward + backward, expanded
@@ -0,0 +1,118 @@
+#######################################################
+#### Compact grid store for the floor plan.
+####
+#### Every per-cell attribute lives in a flat byte array
+#### addressed by the cell index x * cols + y, instead of
+#### one Cell object per square. The arrays may be plain
+#### bytearrays or views into a memory-mapped map file.
+#######################################################
+from array import array
+
+from adjacency import build_csr, patch_csr
+from arena import SearchArena
+from hospital_map import ward_priority
+
+############################################################
+#### Ward priority for every possible ward byte
+############################################################
+def priority_table():
+    return array('b', (ward_priority(chr(code)) for code in range(256)))
+
+
+class Grid:
+    def __init__(self, rows, cols, walls, wards, priorities=None, offsets=None, targets=None):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        #### 1 for a wall, 0 for an open cell
+        self.walls = walls
+        #### One ward character per cell, '0' for corridors
+        self.wards = wards
+        #### Priority of each ward byte, 256 entries
+        self.priorities = priorities if priorities is not None else priority_table()
+        #### CSR graph: open neighbors of i are targets[offsets[i]:offsets[i + 1]]
+        if offsets is None:
+            offsets, targets = build_csr(rows, cols, walls)
+        self.offsets = offsets
+        self.targets = targets
+        #### Bumped on every wall edit so caches can tell the map changed
+        self.version = 0
+        #### Cell index of every wall edit; edits[v] moved the grid to version v + 1
+        self.edits = []
+        #### ALT landmark tables (landmarks.LandmarkTable), built on demand
+        self.landmarks = None
+
+        #### Search state, reused by every query on this grid
+        self.arena = SearchArena(self.size)
+        #### Goal-side state for bidirectional searches, made by
+        #### the first one (see backward_arena)
+        self.backward_state = None
+
+    @classmethod
+    def from_matrices(cls, maze, floor_plan):
+        rows = len(maze)
+        cols = len(maze[0])
+        walls = bytearray(1 if value == 1 else 0 for row in maze for value in row)
+        wards = bytearray(ord(str(value)[0]) for row in floor_plan for value in row)
+        return cls(rows, cols, walls, wards)
+
+    @property
+    def backward_arena(self):
+        if self.backward_state is None:
+            self.backward_state = SearchArena(self.size)
+        return self.backward_state
+
+    def index(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    def pos(self, index):
+        return divmod(index, self.cols)
+
+    def in_bounds(self, pos):
+        return 0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+
+    def is_wall(self, pos):
+        return self.walls[pos[0] * self.cols + pos[1]] == 1
+
+    def ward(self, pos):
+        return chr(self.wards[pos[0] * self.cols + pos[1]])
+
+    def priority(self, pos):
+        return self.priorities[self.wards[pos[0] * self.cols + pos[1]]]
+
+    ############################################################
+    #### Open neighbors of a cell index: E, W, S, N
+    ############################################################
+    def neighbors(self, index):
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    ############################################################
+    #### Dynamic map edits. A grid over a memory-mapped file is
+    #### copied into private arrays on its first edit.
+    ############################################################
+    def set_wall(self, pos, wall=True):
+        if not self.in_bounds(pos):
+            raise ValueError(f"Cell {tuple(pos)} is outside the {self.rows} x {self.cols} map")
+        index = self.index(pos)
+        if bool(self.walls[index]) == wall:
+            return False
+        if not isinstance(self.walls, bytearray):
+            self.walls = bytearray(self.walls)
+        if not isinstance(self.offsets, array):
+            self.offsets = array('i', self.offsets)
+            self.targets = array('i', self.targets)
+
+        self.walls[index] = 1 if wall else 0
+        #### The cell and its N and S neighbors bound every changed row
+        first = max(index - self.cols, 0)
+        last = min(index + self.cols, self.size - 1)
+        patch_csr(self.offsets, self.targets, self.rows, self.cols, self.walls, first, last)
+        self.edits.append(index)
+        self.version += 1
+        return True
+
+    def open_cell(self, pos):
+        return self.set_wall(pos, False)
+
+    def positions(self, indexes):
+        return [divmod(index, self.cols) for index in indexes]
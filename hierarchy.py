@@ -0,0 +1,362 @@
+#######################################################
+#### Hierarchical pathfinding with wards as clusters.
+####
+#### The map is cut into TILE x TILE tiles, and each
+#### connected run of cells sharing a ward letter (or
+#### corridor) inside one tile is a cluster, so no cluster
+#### is larger than a tile however big a ward or corridor
+#### gets. Where two clusters touch, the middle cell pair of
+#### every contiguous border becomes an entrance. Distances
+#### between the entrances of a cluster are precomputed, so
+#### a query links the start and goal to the entrances of
+#### their own clusters, searches the small graph of
+#### entrances and then refines only the clusters the route
+#### crosses back into cells. As in HPA*, a route may be a
+#### few moves longer than the optimum because it must pass
+#### through the chosen entrance cells.
+####
+#### A wall edit only rebuilds the clusters of the tiles it
+#### touched and reconnects the entrances of their neighbors.
+#######################################################
+import weakref
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+
+from arena import NO_PARENT
+from engines import manhattan
+
+#### Side of a tile in cells
+TILE = 16
+
+#### One hierarchy per grid, built on first use
+_hierarchies = weakref.WeakKeyDictionary()
+
+
+class WardHierarchy:
+    def __init__(self, grid, tile=TILE):
+        self.grid = grid
+        self.tile = tile
+        self.tile_rows = -(-grid.rows // tile)
+        self.tile_cols = -(-grid.cols // tile)
+        #### Cell -> cluster ID, -1 for walls
+        self.cluster = array('i', [-1]) * grid.size
+        self.cluster_count = 0
+        #### Tile -> IDs of the clusters inside it
+        self.clusters = {}
+        #### Tile -> entrance pairs on the borders it scanned:
+        #### inside the tile and along its east and south edges
+        self.pairs = {}
+        #### Entrance cell -> {entrance across the border: 1}
+        self.links = {}
+        #### Cluster ID -> its entrance cells
+        self.entrances = {}
+        #### Cluster ID -> {entrance: {other entrance: moves}}
+        self.inner = {}
+        #### Grid version the hierarchy matches
+        self.version = grid.version
+
+        tiles = range(self.tile_rows * self.tile_cols)
+        for tile in tiles:
+            self.fill_tile(tile)
+        for tile in tiles:
+            self.find_entrances(tile)
+        for cluster in range(self.cluster_count):
+            self.connect(cluster)
+
+    ############################################################
+    #### The hierarchy for a grid, brought up to date with the
+    #### wall edits made since it was last used
+    ############################################################
+    @classmethod
+    def for_grid(cls, grid):
+        hierarchy = _hierarchies.get(grid)
+        if hierarchy is None:
+            hierarchy = cls(grid)
+            _hierarchies[grid] = hierarchy
+        elif hierarchy.version != grid.version:
+            hierarchy.update(grid.edits[hierarchy.version:grid.version])
+        return hierarchy
+
+    def tile_of(self, index):
+        x, y = divmod(index, self.grid.cols)
+        return (x // self.tile) * self.tile_cols + y // self.tile
+
+    ############################################################
+    #### Cell indexes of one tile, row by row
+    ############################################################
+    def tile_cells(self, tile):
+        cols = self.grid.cols
+        x0 = (tile // self.tile_cols) * self.tile
+        y0 = (tile % self.tile_cols) * self.tile
+        y1 = min(y0 + self.tile, cols)
+        for x in range(x0, min(x0 + self.tile, self.grid.rows)):
+            yield from range(x * cols + y0, x * cols + y1)
+
+    ############################################################
+    #### Connected components of open cells with the same ward
+    #### inside one tile, numbered after every existing cluster
+    ############################################################
+    def fill_tile(self, tile):
+        grid = self.grid
+        cluster = self.cluster
+        cells = list(self.tile_cells(tile))
+        for index in cells:
+            cluster[index] = -1
+
+        ids = []
+        for seed in cells:
+            if grid.walls[seed] or cluster[seed] != -1:
+                continue
+            ward = grid.wards[seed]
+            cluster[seed] = self.cluster_count
+            frontier = [seed]
+            while frontier:
+                current = frontier.pop()
+                for neighbor in grid.neighbors(current):
+                    if cluster[neighbor] != self.cluster_count and grid.wards[neighbor] == ward and \
+                            self.tile_of(neighbor) == tile:
+                        cluster[neighbor] = self.cluster_count
+                        frontier.append(neighbor)
+            ids.append(self.cluster_count)
+            self.entrances[self.cluster_count] = set()
+            self.cluster_count += 1
+        self.clusters[tile] = ids
+
+    ############################################################
+    #### One entrance pair per contiguous border between two
+    #### clusters, for the borders inside the tile and along
+    #### its east and south edges
+    ############################################################
+    def find_entrances(self, tile):
+        grid = self.grid
+        cols = grid.cols
+        cluster = self.cluster
+        borders = {}
+        for index in self.tile_cells(tile):
+            if grid.walls[index]:
+                continue
+            x, y = divmod(index, cols)
+            #### East neighbor: borders run down a column
+            if y + 1 < cols and not grid.walls[index + 1] and cluster[index] != cluster[index + 1]:
+                key = (cluster[index], cluster[index + 1], 1, y)
+                borders.setdefault(key, []).append((x, index, index + 1))
+            #### South neighbor: borders run along a row
+            if x + 1 < grid.rows and not grid.walls[index + cols] and cluster[index] != cluster[index + cols]:
+                key = (cluster[index], cluster[index + cols], cols, x)
+                borders.setdefault(key, []).append((y, index, index + cols))
+
+        pairs = []
+        for crossings in borders.values():
+            crossings.sort()
+            run = [crossings[0]]
+            for crossing in crossings[1:]:
+                if crossing[0] != run[-1][0] + 1:
+                    pairs.append(self.add_entrance(run))
+                    run = []
+                run.append(crossing)
+            pairs.append(self.add_entrance(run))
+        self.pairs[tile] = pairs
+
+    def add_entrance(self, run):
+        _, inside, outside = run[len(run) // 2]
+        for cell, other in ((inside, outside), (outside, inside)):
+            self.links.setdefault(cell, {})[other] = 1
+            self.entrances[self.cluster[cell]].add(cell)
+        return inside, outside
+
+    def remove_entrance(self, inside, outside):
+        for cell, other in ((inside, outside), (outside, inside)):
+            links = self.links[cell]
+            links.pop(other, None)
+            if not links:
+                del self.links[cell]
+                self.entrances[self.cluster[cell]].discard(cell)
+
+    ############################################################
+    #### Moves from source to the cells of its own cluster.
+    #### A cluster lies inside one tile, so this never visits
+    #### more than TILE * TILE cells.
+    ############################################################
+    def cluster_distances(self, source):
+        grid = self.grid
+        cluster = self.cluster
+        home = cluster[source]
+        distances = {source: 0}
+        frontier = deque([source])
+        while frontier:
+            current = frontier.popleft()
+            for neighbor in grid.neighbors(current):
+                if cluster[neighbor] == home and neighbor not in distances:
+                    distances[neighbor] = distances[current] + 1
+                    frontier.append(neighbor)
+        return distances
+
+    def connect(self, cluster):
+        cells = self.entrances[cluster]
+        edges = {}
+        for source in cells:
+            distances = self.cluster_distances(source)
+            edges[source] = {target: distances[target] for target in cells
+                             if target != source and target in distances}
+        self.inner[cluster] = edges
+
+    ############################################################
+    #### Rebuild after wall edits at the given cell indexes:
+    #### the clusters of every touched tile, the entrances on
+    #### the borders of those tiles and the entrance distances
+    #### of every cluster next to them
+    ############################################################
+    def update(self, edits):
+        tile_cols = self.tile_cols
+        touched = {self.tile_of(index) for index in edits}
+        around = set(touched)
+        for tile in touched:
+            row, col = divmod(tile, tile_cols)
+            for other_row, other_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if 0 <= other_row < self.tile_rows and 0 <= other_col < tile_cols:
+                    around.add(other_row * tile_cols + other_col)
+        #### Borders on the west and north edges of a tile were
+        #### scanned by the tile on that side
+        scanned = touched | {tile - 1 for tile in touched if tile % tile_cols} | \
+            {tile - tile_cols for tile in touched if tile >= tile_cols}
+
+        for tile in scanned:
+            for inside, outside in self.pairs.pop(tile, ()):
+                self.remove_entrance(inside, outside)
+        for tile in touched:
+            for cluster in self.clusters.pop(tile, ()):
+                del self.entrances[cluster]
+                self.inner.pop(cluster, None)
+            self.fill_tile(tile)
+        for tile in scanned:
+            self.find_entrances(tile)
+        for tile in around:
+            for cluster in self.clusters[tile]:
+                self.connect(cluster)
+        self.version = self.grid.version
+
+    ############################################################
+    #### A* over the entrance graph plus the start and goal,
+    #### which are linked to the entrances of their clusters.
+    #### Returns (abstract route, expanded).
+    ############################################################
+    def abstract_route(self, start, goal):
+        cluster = self.cluster
+        extra = {start: {}, goal: {}}
+        start_distances = self.cluster_distances(start)
+        for entrance in self.entrances.get(cluster[start], ()):
+            if entrance in start_distances:
+                extra[start][entrance] = start_distances[entrance]
+        goal_distances = self.cluster_distances(goal)
+        into_goal = {}
+        for entrance in self.entrances.get(cluster[goal], ()):
+            if entrance in goal_distances:
+                into_goal[entrance] = goal_distances[entrance]
+        if goal in start_distances:
+            extra[start][goal] = start_distances[goal]
+        expanded = len(start_distances) + len(goal_distances)
+
+        links = self.links
+        inner = self.inner
+        heuristic = manhattan(self.grid, goal)
+        g = {start: 0}
+        parent = {start: None}
+        closed = set()
+        h = heuristic(start)
+        open_list = [(h, h, start)]
+        while open_list:
+            f, h, current = heappop(open_list)
+            if current in closed:
+                continue
+            closed.add(current)
+            if current == goal:
+                route = []
+                while current is not None:
+                    route.append(current)
+                    current = parent[current]
+                route.reverse()
+                return route, expanded
+            expanded += 1
+
+            successors = dict(links.get(current, {}))
+            successors.update(inner.get(cluster[current], {}).get(current, {}))
+            successors.update(extra.get(current, {}))
+            if current in into_goal:
+                successors[goal] = into_goal[current]
+            for neighbor, cost in successors.items():
+                new_g = g[current] + cost
+                if neighbor not in closed and new_g < g.get(neighbor, new_g + 1):
+                    g[neighbor] = new_g
+                    parent[neighbor] = current
+                    h = heuristic(neighbor)
+                    heappush(open_list, (new_g + h, h, neighbor))
+
+        return None, expanded
+
+    ############################################################
+    #### Cell path between two cells of the same cluster,
+    #### searching only inside that cluster
+    ############################################################
+    def cluster_path(self, start, goal):
+        grid = self.grid
+        cluster = self.cluster
+        home = cluster[start]
+        heuristic = manhattan(grid, goal)
+        arena = grid.arena
+        generation = arena.begin()
+        stamp = arena.stamp
+        g = arena.g
+        parent = arena.parent
+        closed = arena.closed
+
+        arena.visit(start, 0, NO_PARENT)
+        open_list = [(heuristic(start), start)]
+        expanded = 0
+        while open_list:
+            f, current = heappop(open_list)
+            if closed[current] == generation:
+                continue
+            closed[current] = generation
+            if current == goal:
+                return arena.trace(goal), expanded
+            expanded += 1
+            new_g = g[current] + 1
+            for neighbor in grid.neighbors(current):
+                if cluster[neighbor] != home or closed[neighbor] == generation:
+                    continue
+                if stamp[neighbor] != generation or new_g < g[neighbor]:
+                    stamp[neighbor] = generation
+                    g[neighbor] = new_g
+                    parent[neighbor] = current
+                    heappush(open_list, (new_g + heuristic(neighbor), neighbor))
+        return None, expanded
+
+    ############################################################
+    #### Plan between entrances, then refine each leg that
+    #### stays inside a cluster into cells
+    ############################################################
+    def search(self, start, goal):
+        route, expanded = self.abstract_route(start, goal)
+        if route is None:
+            return None, expanded
+
+        path = [start]
+        for current, following in zip(route, route[1:]):
+            if self.cluster[current] != self.cluster[following]:
+                path.append(following)
+                continue
+            leg, leg_expanded = self.cluster_path(current, following)
+            path.extend(leg[1:])
+            expanded += leg_expanded
+        return path, expanded
+
+
+############################################################
+#### Engine entry point, same signature as engines.astar
+############################################################
+def hierarchical_search(grid, start, goal, heuristic=None, stats=None):
+    path, expanded = WardHierarchy.for_grid(grid).search(start, goal)
+    if stats is not None:
+        stats.expanded = expanded
+    return path, expanded
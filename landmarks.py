@@ -0,0 +1,147 @@
+#######################################################
+#### ALT heuristic: A*, landmarks and the triangle
+#### inequality.
+####
+#### For a landmark L with exact distances d(L, .) to every
+#### cell, |d(L, goal) - d(L, v)| never overestimates the
+#### distance from v to goal. Taking the largest bound over
+#### a few well spread landmarks (and Manhattan distance)
+#### gives a consistent heuristic that sees the detours
+#### long walls force, which Manhattan distance alone
+#### cannot. The tables are one BFS per landmark; compiled
+#### map files can carry them (see mapfile.py).
+#######################################################
+import math
+from array import array
+
+from arena import INF
+from distance_cache import distance_field
+from engines import manhattan
+
+#### Landmarks picked when a grid has no stored tables
+LANDMARKS = 8
+METHODS = ("farthest", "planar")
+
+
+############################################################
+#### Open cell closest to the middle of the map, or None
+############################################################
+def middle_cell(grid):
+    middle_x, middle_y = grid.rows // 2, grid.cols // 2
+    best = None
+    best_distance = INF
+    for index in range(grid.size):
+        if not grid.walls[index]:
+            x, y = divmod(index, grid.cols)
+            distance = abs(x - middle_x) + abs(y - middle_y)
+            if distance < best_distance:
+                best, best_distance = index, distance
+    return best
+
+
+def farthest(values):
+    return max(range(len(values)), key=lambda index: values[index] if values[index] != INF else -1)
+
+
+############################################################
+#### Farthest-point selection: each new landmark is the cell
+#### farthest (in moves) from all landmarks picked so far.
+#### Returns (landmarks, their distance tables).
+############################################################
+def farthest_landmarks(grid, count):
+    seed = middle_cell(grid)
+    if seed is None or count <= 0:
+        return [], []
+    landmarks = [farthest(distance_field(grid, seed))]
+    tables = [distance_field(grid, landmarks[0])]
+    nearest = tables[0]
+    while len(landmarks) < count:
+        candidate = farthest(nearest)
+        if nearest[candidate] in (0, INF):
+            break
+        landmarks.append(candidate)
+        tables.append(distance_field(grid, candidate))
+        nearest = array('i', map(min, nearest, tables[-1]))
+    return landmarks, tables
+
+
+############################################################
+#### Planar selection: split the map into equal angle
+#### sectors around its middle and take the reachable cell
+#### farthest from the middle in each sector
+############################################################
+def planar_landmarks(grid, count):
+    seed = middle_cell(grid)
+    if seed is None or count <= 0:
+        return [], []
+    reachable = distance_field(grid, seed)
+    middle_x, middle_y = divmod(seed, grid.cols)
+    best = [None] * count
+    best_distance = [-1] * count
+    for index in range(grid.size):
+        if reachable[index] == INF:
+            continue
+        x, y = divmod(index, grid.cols)
+        angle = math.atan2(x - middle_x, y - middle_y) % (2 * math.pi)
+        sector = min(int(angle / (2 * math.pi) * count), count - 1)
+        distance = abs(x - middle_x) + abs(y - middle_y)
+        if distance > best_distance[sector]:
+            best[sector], best_distance[sector] = index, distance
+    landmarks = [index for index in best if index is not None]
+    return landmarks, [distance_field(grid, landmark) for landmark in landmarks]
+
+
+class LandmarkTable:
+    def __init__(self, landmarks, tables, version=0):
+        #### Landmark cell indexes and, per landmark, moves to every cell
+        self.landmarks = landmarks
+        self.tables = tables
+        #### Grid version the tables were computed on
+        self.version = version
+
+    @classmethod
+    def build(cls, grid, count=LANDMARKS, method="farthest"):
+        select = planar_landmarks if method == "planar" else farthest_landmarks
+        landmarks, tables = select(grid, count)
+        return cls(landmarks, tables, grid.version)
+
+    @classmethod
+    def from_cells(cls, grid, landmarks):
+        landmarks = [landmark for landmark in landmarks if not grid.walls[landmark]]
+        return cls(landmarks, [distance_field(grid, landmark) for landmark in landmarks], grid.version)
+
+    ############################################################
+    #### Heuristic to goal, as a function of a cell index
+    ############################################################
+    def heuristic(self, goal, grid):
+        to_goal = manhattan(grid, goal)
+        bounds = [(table, table[goal]) for table in self.tables if table[goal] != INF]
+
+        def heuristic(index):
+            best = to_goal(index)
+            for table, goal_distance in bounds:
+                distance = table[index]
+                if distance != INF:
+                    bound = goal_distance - distance if goal_distance > distance else distance - goal_distance
+                    if bound > best:
+                        best = bound
+            return best
+
+        return heuristic
+
+
+############################################################
+#### Tables for a grid: the stored ones while the map is
+#### unchanged, rebuilt from the same landmark cells after a
+#### wall edit, or picked fresh the first time
+############################################################
+def landmark_table(grid, count=LANDMARKS, method="farthest"):
+    table = grid.landmarks
+    if table is not None and table.version == grid.version:
+        return table
+    if table is not None and table.landmarks:
+        table = LandmarkTable.from_cells(grid, table.landmarks)
+    else:
+        table = LandmarkTable.build(grid, count, method)
+    grid.landmarks = table
+    return table
@@ -0,0 +1,270 @@
+#######################################################
+#### Seeded generator for large hospital floor plans.
+####
+#### The campus is a lattice of corridors around building
+#### blocks. Each block is walled in, opens onto the
+#### corridors through a few doorways and belongs to one
+#### ward (sometimes two). Its inside is split into rooms by
+#### recursive division: every dividing wall gets one
+#### doorway, and no later wall is placed in front of an
+#### existing doorway, so every open cell can reach every
+#### other. The result uses the same representation as
+#### hospital_map: a walls matrix of 0/1 and a ward overlay
+#### with ward letters, 0 for corridors and 1 for walls.
+#### Matching delivery job files can be written alongside:
+####
+####     python map_generator.py campus --rows 1000 --cols 1000 --seed 7 --jobs 200
+#######################################################
+import argparse
+import os
+import random
+import sys
+
+from grid import Grid
+from hospital_map import WARD_PRIORITY
+
+#### Corridor width and the range of block sides, walls included
+CORRIDOR = 2
+BLOCK_MIN = 12
+BLOCK_MAX = 32
+#### Smallest room side and the side below which rooms may stop splitting
+ROOM_MIN = 3
+ROOM_MAX = 9
+#### Chance that a block is an open lobby instead of a ward
+LOBBY_CHANCE = 0.05
+#### Chance that the first split of a block starts a second ward
+SECOND_WARD_CHANCE = 0.3
+
+WARD_LETTERS = tuple(WARD_PRIORITY)
+CORRIDOR_BYTE = ord('0')
+WALL_BYTE = ord('1')
+
+
+############################################################
+#### (start, end) spans of the blocks along one axis, with
+#### a corridor before, between and after them
+############################################################
+def block_spans(length, rng):
+    spans = []
+    start = CORRIDOR
+    while start + BLOCK_MIN + CORRIDOR <= length:
+        end = min(start + rng.randint(BLOCK_MIN, BLOCK_MAX), length - CORRIDOR)
+        if length - CORRIDOR - end < BLOCK_MIN + CORRIDOR:
+            #### Too little left for another block: take the rest
+            end = length - CORRIDOR
+        spans.append((start, end))
+        start = end + CORRIDOR
+    return spans
+
+
+class FloorPlanGenerator:
+    def __init__(self, rows, cols, seed=0):
+        self.rows = rows
+        self.cols = cols
+        self.rng = random.Random(seed)
+        self.walls = bytearray(rows * cols)
+        self.wards = bytearray([CORRIDOR_BYTE]) * (rows * cols)
+        #### Indexes of every doorway carved so far
+        self.doors = set()
+
+    def set_wall(self, x, y):
+        index = x * self.cols + y
+        self.walls[index] = 1
+        self.wards[index] = WALL_BYTE
+
+    def set_door(self, x, y, ward):
+        index = x * self.cols + y
+        self.walls[index] = 0
+        self.wards[index] = ward
+        self.doors.add(index)
+
+    def is_door(self, x, y):
+        return x * self.cols + y in self.doors
+
+    def generate(self):
+        rng = self.rng
+        for x0, x1 in block_spans(self.rows, rng):
+            for y0, y1 in block_spans(self.cols, rng):
+                if rng.random() < LOBBY_CHANCE:
+                    continue
+                self.build_block(x0, x1, y0, y1)
+        return self
+
+    ############################################################
+    #### Walls around the block, doorways onto the corridors
+    #### and rooms inside
+    ############################################################
+    def build_block(self, x0, x1, y0, y1):
+        rng = self.rng
+        ward = ord(rng.choice(WARD_LETTERS))
+        for y in range(y0, y1):
+            self.set_wall(x0, y)
+            self.set_wall(x1 - 1, y)
+        for x in range(x0, x1):
+            self.set_wall(x, y0)
+            self.set_wall(x, y1 - 1)
+
+        sides = [lambda: (x0, rng.randrange(y0 + 1, y1 - 1)),
+                 lambda: (x1 - 1, rng.randrange(y0 + 1, y1 - 1)),
+                 lambda: (rng.randrange(x0 + 1, x1 - 1), y0),
+                 lambda: (rng.randrange(x0 + 1, x1 - 1), y1 - 1)]
+        for side in rng.sample(sides, rng.randint(1, 3)):
+            self.set_door(*side(), ward)
+
+        self.divide(x0 + 1, x1 - 1, y0 + 1, y1 - 1, ward, True)
+
+    ############################################################
+    #### Recursive division of the open area [x0, x1) x [y0, y1)
+    ############################################################
+    def divide(self, x0, x1, y0, y1, ward, first=False):
+        rng = self.rng
+        height = x1 - x0
+        width = y1 - y0
+        can_split_rows = height >= 2 * ROOM_MIN + 1
+        can_split_cols = width >= 2 * ROOM_MIN + 1
+        if (not can_split_rows and not can_split_cols) or \
+                (height <= ROOM_MAX and width <= ROOM_MAX and rng.random() < 0.5):
+            self.fill(x0, x1, y0, y1, ward)
+            return
+
+        split_rows = can_split_rows and (not can_split_cols or height > width or
+                                         (height == width and rng.random() < 0.5))
+        other = ord(rng.choice(WARD_LETTERS)) if first and rng.random() < SECOND_WARD_CHANCE else ward
+        if split_rows:
+            #### A horizontal wall on row x, not in front of a doorway
+            choices = [x for x in range(x0 + ROOM_MIN, x1 - ROOM_MIN)
+                       if not self.is_door(x, y0 - 1) and not self.is_door(x, y1)]
+            if not choices:
+                self.fill(x0, x1, y0, y1, ward)
+                return
+            x = rng.choice(choices)
+            for y in range(y0, y1):
+                self.set_wall(x, y)
+            self.set_door(x, rng.randrange(y0, y1), ward)
+            self.divide(x0, x, y0, y1, ward)
+            self.divide(x + 1, x1, y0, y1, other)
+        else:
+            choices = [y for y in range(y0 + ROOM_MIN, y1 - ROOM_MIN)
+                       if not self.is_door(x0 - 1, y) and not self.is_door(x1, y)]
+            if not choices:
+                self.fill(x0, x1, y0, y1, ward)
+                return
+            y = rng.choice(choices)
+            for x in range(x0, x1):
+                self.set_wall(x, y)
+            self.set_door(rng.randrange(x0, x1), y, ward)
+            self.divide(x0, x1, y0, y, ward)
+            self.divide(x0, x1, y + 1, y1, other)
+
+    def fill(self, x0, x1, y0, y1, ward):
+        row = bytes([ward]) * (y1 - y0)
+        for x in range(x0, x1):
+            start = x * self.cols + y0
+            self.wards[start:start + len(row)] = row
+
+    def grid(self):
+        return Grid(self.rows, self.cols, self.walls, self.wards)
+
+    ############################################################
+    #### The plan as hospital_map style maze and floor_plan
+    ############################################################
+    def matrices(self):
+        cols = self.cols
+        maze = [list(self.walls[x * cols:(x + 1) * cols]) for x in range(self.rows)]
+        floor_plan = []
+        for x in range(self.rows):
+            row = self.wards[x * cols:(x + 1) * cols].decode('ascii')
+            floor_plan.append([int(ward) if ward.isdigit() else ward for ward in row])
+        return maze, floor_plan
+
+
+def generate_floor_plan(rows, cols, seed=0):
+    return FloorPlanGenerator(rows, cols, seed).generate().matrices()
+
+
+def generate_grid(rows, cols, seed=0):
+    return FloorPlanGenerator(rows, cols, seed).generate().grid()
+
+
+############################################################
+#### Delivery jobs on a grid: each starts on an open cell
+#### and delivers to cells inside wards
+############################################################
+def generate_jobs(grid, count, goals, seed=0, algorithms=("astar",)):
+    rng = random.Random(seed)
+    open_cells = [index for index in range(grid.size) if not grid.walls[index]]
+    ward_cells = [index for index in open_cells if grid.priorities[grid.wards[index]] > 0]
+    if not ward_cells:
+        raise ValueError("The floor plan has no ward cells to deliver to")
+
+    jobs = []
+    for number in range(count):
+        start = grid.pos(rng.choice(open_cells))
+        targets = [grid.pos(index) for index in rng.sample(ward_cells, min(goals, len(ward_cells)))]
+        jobs.append(format_job(algorithms[number % len(algorithms)], start, targets))
+    return jobs
+
+
+def format_job(alg, start, goals):
+    return (f"Delivery algorithm: {alg}\n"
+            f"Start location: ({start[0]}, {start[1]})\n"
+            f"Delivery locations: {', '.join(f'({x}, {y})' for x, y in goals)}\n")
+
+
+############################################################
+#### A matrix in the loose text format of the "floor plan
+#### walls matrix" files, readable by mapfile.read_matrix_text
+############################################################
+def write_matrix_text(matrix, file_path):
+    with open(file_path, 'w') as file:
+        file.write("floor_plan = [\n")
+        for row in matrix:
+            file.write("\t" + ", ".join(str(value) for value in row) + ",\n")
+        file.write("]\n")
+
+
+def main(argv=None):
+    from mapfile import compile_map
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic hospital floor plan and delivery jobs.")
+    parser.add_argument("output_dir", help="directory for the generated files")
+    parser.add_argument("--rows", type=int, default=500, help="map rows (default: 500)")
+    parser.add_argument("--cols", type=int, default=500, help="map columns (default: 500)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--jobs", type=int, default=0, help="delivery job files to write (default: 0)")
+    parser.add_argument("--goals", type=int, default=4, help="delivery locations per job (default: 4)")
+    parser.add_argument("--algs", nargs="+", default=["astar"],
+                        help="delivery algorithms, used by the jobs in turn (default: astar)")
+    parser.add_argument("--no-text", action="store_true", help="skip the walls and wards matrix text files")
+    parser.add_argument("--landmarks", type=int, default=0, metavar="N",
+                        help="store N ALT landmark tables in the map file (default: 0)")
+    args = parser.parse_args(argv)
+
+    if args.rows < BLOCK_MIN + 2 * CORRIDOR or args.cols < BLOCK_MIN + 2 * CORRIDOR:
+        parser.error(f"the map must be at least {BLOCK_MIN + 2 * CORRIDOR} cells on each side")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    maze, floor_plan = generate_floor_plan(args.rows, args.cols, args.seed)
+    if not args.no_text:
+        write_matrix_text(maze, os.path.join(args.output_dir, "walls.txt"))
+        write_matrix_text(floor_plan, os.path.join(args.output_dir, "wards.txt"))
+    map_path = os.path.join(args.output_dir, "hospital.map")
+    grid = compile_map(maze, floor_plan, map_path, args.landmarks)
+    print(f"Wrote {map_path}: {grid.rows} x {grid.cols} cells")
+
+    if args.jobs:
+        job_dir = os.path.join(args.output_dir, "jobs")
+        os.makedirs(job_dir, exist_ok=True)
+        paths = []
+        for number, job in enumerate(generate_jobs(grid, args.jobs, args.goals, args.seed, args.algs)):
+            paths.append(os.path.join(job_dir, f"job_{number:05d}.txt"))
+            with open(paths[-1], 'w') as file:
+                file.write(job)
+        with open(os.path.join(args.output_dir, "jobs.txt"), 'w') as file:
+            file.write("".join(path + "\n" for path in paths))
+        print(f"Wrote {len(paths)} jobs to {job_dir}, listed in {os.path.join(args.output_dir, 'jobs.txt')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#######################################################
+#### Compiled binary map files.
+####
+#### The compiler turns a walls matrix and a ward overlay
+#### into one versioned file; the loader memory-maps it and
+#### builds a Grid on views into the mapping, so nothing is
+#### copied at startup and every process that loads the
+#### same file shares one page-cache copy.
+####
+#### Layout, little-endian, sections padded to 8 bytes:
+####     header      magic "HMAP", version, landmarks, rows, cols, edges
+####     priorities  256 signed bytes, one per ward byte
+####     walls       one byte per cell, 1 for a wall
+####     wards       one ward character per cell
+####     offsets     rows * cols + 1 int32 CSR offsets
+####     targets     edges int32 CSR neighbor indexes
+####     landmarks   int32 cell index of each ALT landmark
+####     tables      per landmark, rows * cols int32 distances
+#### Files without landmarks have a count of 0 and end after
+#### the targets.
+#######################################################
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+
+from grid import Grid, priority_table
+from hospital_map import maze, floor_plan
+from landmarks import LANDMARKS, METHODS, LandmarkTable
+
+MAGIC = b"HMAP"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIII")
+
+
+def padded(length):
+    return (length + 7) & ~7
+
+
+def section_offsets(size, edges, landmarks=0):
+    priorities = padded(HEADER.size)
+    walls = priorities + padded(256)
+    wards = walls + padded(size)
+    offsets = wards + padded(size)
+    targets = offsets + padded(4 * (size + 1))
+    landmark_cells = targets + padded(4 * edges)
+    tables = landmark_cells + padded(4 * landmarks)
+    return priorities, walls, wards, offsets, targets, landmark_cells, tables, tables + 4 * size * landmarks
+
+
+def int32_bytes(values):
+    section = array('i', values)
+    if sys.byteorder != "little":
+        section.byteswap()
+    return section.tobytes()
+
+
+############################################################
+#### Read a matrix from the loose text format used by the
+#### "floor plan walls matrix" and "floor plan wards matrix"
+#### files: one row per line, values separated by commas
+############################################################
+def read_matrix_text(file_path):
+    rows = []
+    with open(file_path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.endswith("[") or line.startswith("]"):
+                continue
+            values = [value.strip() for value in line.split(",") if value.strip()]
+            rows.append([int(value) if value.isdigit() else value for value in values])
+    return rows
+
+
+############################################################
+#### Write the map; landmarks > 0 also stores that many ALT
+#### landmark tables, picked with the given method
+############################################################
+def compile_map(maze, floor_plan, output_path, landmarks=0, method="farthest"):
+    grid = Grid.from_matrices(maze, floor_plan)
+    table = LandmarkTable.build(grid, landmarks, method) if landmarks else LandmarkTable([], [])
+    count = len(table.landmarks)
+    edges = len(grid.targets)
+    priorities_at, walls_at, wards_at, offsets_at, targets_at, landmarks_at, tables_at, end = \
+        section_offsets(grid.size, edges, count)
+
+    data = bytearray(end)
+    HEADER.pack_into(data, 0, MAGIC, VERSION, count, grid.rows, grid.cols, edges)
+    data[priorities_at:priorities_at + 256] = priority_table().tobytes()
+    data[walls_at:walls_at + grid.size] = grid.walls
+    data[wards_at:wards_at + grid.size] = grid.wards
+    sections = [(offsets_at, grid.offsets), (targets_at, grid.targets), (landmarks_at, table.landmarks)]
+    sections += [(tables_at + 4 * grid.size * number, values) for number, values in enumerate(table.tables)]
+    for at, values in sections:
+        data[at:at + 4 * len(values)] = int32_bytes(values)
+
+    with open(output_path, 'wb') as file:
+        file.write(data)
+    if count:
+        grid.landmarks = table
+    return grid
+
+
+############################################################
+#### Memory-map a compiled map and return a Grid over it
+############################################################
+def load_map(file_path):
+    with open(file_path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapping) < HEADER.size:
+        raise ValueError(f"{file_path} is not a compiled map")
+    magic, version, landmarks, rows, cols, edges = HEADER.unpack_from(mapping, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{file_path} is not a compiled map")
+    if version != VERSION:
+        raise ValueError(f"{file_path} has map format version {version}, expected {VERSION}")
+
+    size = rows * cols
+    priorities_at, walls_at, wards_at, offsets_at, targets_at, landmarks_at, tables_at, end = \
+        section_offsets(size, edges, landmarks)
+    if len(mapping) < end:
+        raise ValueError(f"{file_path} is truncated")
+    if sys.byteorder != "little":
+        raise ValueError("Compiled maps can only be memory-mapped on little-endian machines")
+
+    view = memoryview(mapping)
+    grid = Grid(rows, cols,
+                view[walls_at:walls_at + size],
+                view[wards_at:wards_at + size],
+                view[priorities_at:priorities_at + 256].cast('b'),
+                view[offsets_at:offsets_at + 4 * (size + 1)].cast('i'),
+                view[targets_at:targets_at + 4 * edges].cast('i'))
+    if landmarks:
+        grid.landmarks = LandmarkTable(
+            list(view[landmarks_at:landmarks_at + 4 * landmarks].cast('i')),
+            [view[at:at + 4 * size].cast('i') for at in range(tables_at, end, 4 * size)])
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the floor plan into a binary map file.")
+    parser.add_argument("output", help="map file to write")
+    parser.add_argument("--walls", metavar="FILE", help="walls matrix text file (default: hospital_map.maze)")
+    parser.add_argument("--wards", metavar="FILE", help="wards matrix text file (default: hospital_map.floor_plan)")
+    parser.add_argument("--landmarks", type=int, nargs="?", const=LANDMARKS, default=0, metavar="N",
+                        help=f"store N ALT landmark tables for the alt algorithm (default N: {LANDMARKS})")
+    parser.add_argument("--landmark-method", choices=METHODS, default="farthest",
+                        help="how to pick the landmarks (default: farthest)")
+    args = parser.parse_args(argv)
+
+    walls = read_matrix_text(args.walls) if args.walls else maze
+    wards = read_matrix_text(args.wards) if args.wards else floor_plan
+    if len(walls) != len(wards) or any(len(a) != len(b) for a, b in zip(walls, wards)):
+        print("Walls and wards matrices must have the same shape", file=sys.stderr)
+        return 1
+
+    grid = compile_map(walls, wards, args.output, args.landmarks, args.landmark_method)
+    landmarks = len(grid.landmarks.landmarks) if grid.landmarks else 0
+    print(f"Wrote {args.output}: {grid.rows} x {grid.cols} cells, {landmarks} landmarks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
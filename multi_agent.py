@@ -0,0 +1,382 @@
+#######################################################
+#### Cooperative multi-robot planning.
+####
+#### Robots are planned one after another with space-time
+#### A* (cooperative A*). Every planned robot writes the
+#### cells it occupies at each time step, and the moves it
+#### makes, into a shared reservation table; robots planned
+#### later treat those as obstacles, so no two robots share
+#### a cell at the same time or swap places through each
+#### other. A robot that has finished stays parked on its
+#### last goal, and a robot not planned yet is parked on its
+#### start, so nobody is routed through a robot that is
+#### still waiting. When robots end up waiting on each
+#### other's starts (two robots swapping cells, say), the
+#### waiting robots are promised to leave their starts after
+#### a few steps and planned again, and that plan is kept if
+#### every one of them that was driven over got away. Each
+#### time step a robot either moves to a neighboring cell or
+#### waits.
+####
+#### The heuristic is the exact distance to the goal on the
+#### empty map (one BFS distance field per goal), so each
+#### search only wanders as far as other robots force it to.
+#######################################################
+import argparse
+import random
+import sys
+from heapq import heappush, heappop
+
+from arena import INF
+from distance_cache import distance_field
+
+
+class ReservationTable:
+    def __init__(self):
+        #### (cell, time) -> robot
+        self.cells = {}
+        #### (from cell, to cell, time) -> robot
+        self.moves = {}
+        #### cell -> time a robot parked there for good
+        self.parked = {}
+        #### cell -> last time step a waiting robot keeps it
+        self.holds = {}
+        #### cell -> last time step it is reserved
+        self.last_reserved = {}
+
+    def is_free(self, cell, time):
+        if (cell, time) in self.cells:
+            return False
+        if time <= self.holds.get(cell, -1):
+            return False
+        parked = self.parked.get(cell)
+        return parked is None or time < parked
+
+    ############################################################
+    #### Moving a -> b between time and time + 1 is blocked if
+    #### another robot moves b -> a at the same time
+    ############################################################
+    def can_move(self, a, b, time):
+        return (b, a, time) not in self.moves
+
+    def can_park(self, cell, time):
+        return self.last_reserved.get(cell, -1) < time and self.holds.get(cell, -1) < time and \
+            cell not in self.parked
+
+    ############################################################
+    #### Hold a cell from time on, e.g. a start from time 0
+    #### until its robot is planned
+    ############################################################
+    def park(self, cell, time=0):
+        self.parked[cell] = time
+
+    def unpark(self, cell):
+        self.parked.pop(cell, None)
+        self.holds.pop(cell, None)
+
+    ############################################################
+    #### Keep a cell until time only, for a waiting robot that
+    #### will have to leave it by then
+    ############################################################
+    def hold(self, cell, time):
+        self.parked.pop(cell, None)
+        self.holds[cell] = time
+
+    def copy(self):
+        table = ReservationTable()
+        table.cells = dict(self.cells)
+        table.moves = dict(self.moves)
+        table.parked = dict(self.parked)
+        table.holds = dict(self.holds)
+        table.last_reserved = dict(self.last_reserved)
+        return table
+
+    def reserve(self, robot, schedule):
+        for time, cell in enumerate(schedule):
+            self.cells[(cell, time)] = robot
+            self.last_reserved[cell] = max(self.last_reserved.get(cell, -1), time)
+            if time > 0:
+                self.moves[(schedule[time - 1], cell, time - 1)] = robot
+        self.parked[schedule[-1]] = len(schedule) - 1
+
+
+class MultiAgentPlan:
+    def __init__(self, robots):
+        #### Per robot: one cell position per time step
+        self.schedules = [None] * robots
+        self.success = [False] * robots
+        self.expanded = 0
+
+    def copy(self):
+        plan = MultiAgentPlan(0)
+        plan.schedules = list(self.schedules)
+        plan.success = list(self.success)
+        plan.expanded = self.expanded
+        return plan
+
+    @property
+    def makespan(self):
+        return max((len(schedule) - 1 for schedule in self.schedules if schedule), default=0)
+
+    @property
+    def cost(self):
+        return sum(len(schedule) - 1 for schedule in self.schedules if schedule)
+
+
+class CooperativePlanner:
+    def __init__(self, grid, slack=64, leave_by=8):
+        self.grid = grid
+        #### Extra time steps a leg may take beyond twice its length
+        self.slack = slack
+        #### Steps a waiting robot may keep its start when others
+        #### need it to break a deadlock
+        self.leave_by = leave_by
+        self.fields = {}
+
+    def field(self, goal):
+        if goal not in self.fields:
+            self.fields[goal] = distance_field(self.grid, goal)
+        return self.fields[goal]
+
+    ############################################################
+    #### Whether goal can be reached at all around the robots
+    #### parked for good by time t0. A space-time search that
+    #### cannot get through would only find that out at its
+    #### horizon, after expanding every cell at every step.
+    ############################################################
+    def reachable(self, table, start, goal, t0):
+        parked = table.parked
+        offsets = self.grid.offsets
+        targets = self.grid.targets
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            cell = frontier.pop()
+            if cell == goal:
+                return True
+            for neighbor in targets[offsets[cell]:offsets[cell + 1]]:
+                if neighbor not in seen and parked.get(neighbor, INF) > t0:
+                    seen.add(neighbor)
+                    frontier.append(neighbor)
+        return False
+
+    ############################################################
+    #### Space-time A* for one leg, starting at time t0.
+    #### Returns (cells from t0 to arrival, expanded), or
+    #### (None, expanded) when no schedule fits the horizon.
+    ############################################################
+    def leg(self, table, start, goal, t0, park):
+        field = self.field(goal)
+        if field[start] == INF:
+            return None, 0
+        #### A goal another robot holds before we could get there
+        parked = table.parked.get(goal)
+        if parked is not None and (park or parked <= t0 + field[start]):
+            return None, 0
+        if not self.reachable(table, start, goal, t0):
+            return None, 0
+        horizon = t0 + 2 * field[start] + self.slack
+        offsets = self.grid.offsets
+        targets = self.grid.targets
+
+        parent = {(start, t0): None}
+        open_list = [(t0 + field[start], t0, start)]
+        closed = set()
+        expanded = 0
+        while open_list:
+            f, time, cell = heappop(open_list)
+            state = (cell, time)
+            if state in closed:
+                continue
+            closed.add(state)
+
+            if cell == goal and (not park or table.can_park(cell, time)):
+                schedule = []
+                while state is not None:
+                    schedule.append(state[0])
+                    state = parent[state]
+                schedule.reverse()
+                return schedule, expanded
+            expanded += 1
+            if time >= horizon:
+                continue
+
+            #### Wait in place, or move to an open neighbor
+            following = time + 1
+            for neighbor in [cell] + list(targets[offsets[cell]:offsets[cell + 1]]):
+                next_state = (neighbor, following)
+                if next_state in closed or next_state in parent:
+                    continue
+                if not table.is_free(neighbor, following) or not table.can_move(cell, neighbor, time):
+                    continue
+                parent[next_state] = (cell, time)
+                heappush(open_list, (following + field[neighbor], following, neighbor))
+        return None, expanded
+
+    ############################################################
+    #### Plan every robot in turn. robots is a list of
+    #### (start, [goal, ...]) pairs in positions. Robots that
+    #### fail get another turn after everyone else, for as
+    #### long as that gets more of them through; one that
+    #### still cannot be scheduled stays parked on its start,
+    #### so every robot always has a schedule.
+    ############################################################
+    def plan(self, robots):
+        table = ReservationTable()
+        result = MultiAgentPlan(len(robots))
+
+        starts = [self.grid.index(start) for start, _ in robots]
+        if len(set(starts)) != len(starts):
+            raise ValueError("Two robots cannot start on the same cell")
+        #### Nobody may drive through a robot still waiting to start
+        for start in starts:
+            table.park(start)
+
+        waiting = list(range(len(robots)))
+        while waiting:
+            failed = [robot for robot in waiting
+                      if not self.plan_robot(table, result, robot, starts[robot], robots[robot][1])]
+            if len(failed) == len(waiting):
+                table, result, failed = self.break_deadlock(table, result, robots, starts, failed)
+                if len(failed) == len(waiting):
+                    break
+            waiting = failed
+        return result
+
+    ############################################################
+    #### Every waiting robot failed. For each one headed for
+    #### another waiting robot's start, try a plan where all
+    #### waiting robots hold their starts only until leave_by:
+    #### that robot goes first, the others after it. The trial
+    #### is kept when it delivers more and every robot still
+    #### failing sits on a start nobody else entered.
+    #### Returns (table, result, robots still failing).
+    ############################################################
+    def break_deadlock(self, table, result, robots, starts, waiting):
+        grid = self.grid
+        held = {starts[robot] for robot in waiting}
+        for first in waiting:
+            if held.isdisjoint(grid.index(goal) for goal in robots[first][1]):
+                continue
+            trial = table.copy()
+            plan = result.copy()
+            for robot in waiting:
+                trial.hold(starts[robot], self.leave_by)
+            order = [first] + [robot for robot in waiting if robot != first]
+            failed = [robot for robot in order
+                      if not self.plan_robot(trial, plan, robot, starts[robot], robots[robot][1])]
+            result.expanded = plan.expanded
+            driven_over = any(trial.last_reserved.get(starts[robot], -1) >= 0 for robot in failed)
+            if len(failed) < len(waiting) and not driven_over:
+                return trial, plan, sorted(failed)
+        return table, result, waiting
+
+    def plan_robot(self, table, result, robot, start, goals):
+        grid = self.grid
+        table.unpark(start)
+        schedule = [start]
+        for number, goal in enumerate(goals):
+            park = number == len(goals) - 1
+            part, expanded = self.leg(table, schedule[-1], grid.index(goal), len(schedule) - 1, park)
+            result.expanded += expanded
+            if part is None:
+                #### Nobody else was allowed onto the start, so it can stay there
+                table.park(start)
+                result.schedules[robot] = grid.positions([start])
+                return False
+            schedule.extend(part[1:])
+
+        table.reserve(robot, schedule)
+        result.schedules[robot] = grid.positions(schedule)
+        result.success[robot] = True
+        return True
+
+
+############################################################
+#### Vertex and swap conflicts between schedules, including
+#### robots parked after they finish, and robots left
+#### without a schedule. Empty means safe.
+############################################################
+def find_conflicts(schedules):
+    conflicts = [("unscheduled", 0, None, robot, None)
+                 for robot, schedule in enumerate(schedules) if not schedule]
+    robots = [robot for robot, schedule in enumerate(schedules) if schedule]
+    makespan = max((len(schedules[robot]) for robot in robots), default=0)
+
+    def at(robot, time):
+        schedule = schedules[robot]
+        return schedule[min(time, len(schedule) - 1)]
+
+    for time in range(makespan):
+        seen = {}
+        for robot in robots:
+            cell = at(robot, time)
+            if cell in seen:
+                conflicts.append(("vertex", time, cell, seen[cell], robot))
+            seen[cell] = robot
+        if time + 1 < makespan:
+            for number, a in enumerate(robots):
+                for b in robots[number + 1:]:
+                    if at(a, time) == at(b, time + 1) and at(b, time) == at(a, time + 1) and \
+                            at(a, time) != at(a, time + 1):
+                        conflicts.append(("swap", time, at(a, time), a, b))
+    return conflicts
+
+
+############################################################
+#### Regression check: plan random robots between cells
+#### that can all reach each other, several times over, and
+#### report failures and conflicts. Exits non-zero if any
+#### plan has a conflict or a robot without a schedule.
+####
+####     python multi_agent.py --robots 20 40 --runs 10
+############################################################
+def main(argv=None):
+    from grid import Grid
+    from hospital_map import maze, floor_plan
+    from landmarks import middle_cell
+    from mapfile import load_map
+
+    parser = argparse.ArgumentParser(description="Check cooperative plans for conflicts.")
+    parser.add_argument("--map", metavar="FILE", help="compiled map file (default: the bundled hospital map)")
+    parser.add_argument("--robots", type=int, nargs="+", default=[20, 40], help="robot counts (default: 20 40)")
+    parser.add_argument("--goals", type=int, default=2, help="delivery locations per robot (default: 2)")
+    parser.add_argument("--runs", type=int, default=10, help="random plans per robot count (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    grid = load_map(args.map) if args.map else Grid.from_matrices(maze, floor_plan)
+    field = distance_field(grid, middle_cell(grid))
+    cells = [index for index in range(grid.size) if field[index] != INF]
+    planner = CooperativePlanner(grid)
+
+    problems = 0
+    if not args.map:
+        #### Robots headed for each other's starts must not wait
+        #### on each other forever
+        for robots in ([((8, 10), [(8, 15)]), ((8, 15), [(8, 10)])],
+                       [((8, 10), [(8, 15), (10, 12)]), ((8, 15), [(8, 10)])]):
+            plan = planner.plan(robots)
+            conflicts = find_conflicts(plan.schedules)
+            swapped = all(plan.success) and not conflicts
+            print(f"swap {robots}: {'ok' if swapped else 'FAILED'}")
+            problems += not swapped
+    for count in args.robots:
+        failed = 0
+        conflicts = []
+        for run in range(args.runs):
+            rng = random.Random(f"{args.seed}:{count}:{run}")
+            starts = rng.sample(cells, count)
+            robots = [(grid.pos(start), grid.positions(rng.sample(cells, args.goals))) for start in starts]
+            plan = planner.plan(robots)
+            failed += plan.success.count(False)
+            conflicts += find_conflicts(plan.schedules)
+        for conflict in conflicts[:10]:
+            print(conflict)
+        print(f"{count} robots x {args.runs} runs: {failed} not delivered, {len(conflicts)} conflicts")
+        problems += len(conflicts)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#######################################################
+#### In-memory LRU cache of finished paths.
+####
+#### Robots run the same legs over and over, so the solver
+#### keeps recent answers keyed by
+####     (start, goal, algorithm, grid version)
+#### A wall edit bumps grid.version, so entries for the old
+#### map are never returned again; sync() drops them as soon
+#### as the version changes. The cache is bounded both by
+#### entry count and by the total cells of stored paths.
+#######################################################
+from collections import OrderedDict
+
+MAX_ENTRIES = 4096
+MAX_CELLS = 1_000_000
+
+#### Returned by get() when the key is not cached; a cached
+#### unreachable goal comes back as None
+MISS = object()
+
+
+class PathCache:
+    def __init__(self, max_entries=MAX_ENTRIES, max_cells=MAX_CELLS):
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        #### key -> path as a tuple of positions, or None if unreachable
+        self.entries = OrderedDict()
+        self.cells = 0
+        #### Grid version the entries were computed on
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    ############################################################
+    #### Path stored for key, or MISS. The path is a fresh list
+    #### the caller may change.
+    ############################################################
+    def get(self, key):
+        path = self.entries.get(key, MISS)
+        if path is MISS:
+            self.misses += 1
+            return MISS
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return list(path) if path is not None else None
+
+    def put(self, key, path):
+        cells = len(path) if path else 0
+        if cells > self.max_cells or self.max_entries <= 0:
+            return
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = tuple(path) if path is not None else None
+        self.cells += cells
+        while len(self.entries) > self.max_entries or self.cells > self.max_cells:
+            self.remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def remove(self, key):
+        path = self.entries.pop(key)
+        self.cells -= len(path) if path else 0
+
+    def clear(self):
+        self.entries.clear()
+        self.cells = 0
+
+    ############################################################
+    #### Forget every entry once the map has changed
+    ############################################################
+    def sync(self, version):
+        if version != self.version:
+            self.evictions += len(self.entries)
+            self.clear()
+            self.version = version
+
+    def to_dict(self):
+        return {
+            "entries": len(self.entries),
+            "cells": self.cells,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,178 @@
+#######################################################
+#### Viewport renderer for large floor plans.
+####
+#### The ward and wall layers are rasterized once into a
+#### PIL image with one pixel per cell. Each redraw crops
+#### the part of that image inside the viewport, scales it
+#### to the current zoom and shows it as a single canvas
+#### image, so the canvas item count stays fixed and redraw
+#### time depends on the window size, not the map size.
+####
+#### Drag with the left mouse button to pan; use the mouse
+#### wheel to zoom around the pointer. Paths and markers
+#### drawn with draw_cell() follow the view.
+#######################################################
+import math
+
+from PIL import Image, ImageColor, ImageTk
+
+#### Cell colors by ward letter
+WARD_COLORS = {
+    'm': 'lightblue',
+    'g': 'firebrick',
+    'e': 'yellow',
+    'a': 'grey',
+    'i': 'powderblue',
+    'o': 'forestgreen',
+    'b': 'mediumpurple',
+    'p': 'yellowgreen',
+    's': 'lightcoral',
+    'd': 'olivedrab',
+    'c': 'sandybrown',
+    'h': 'chocolate',
+}
+DEFAULT_COLOR = 'white'
+WALL_COLOR = 'black'
+
+MIN_ZOOM = 0.1
+MAX_ZOOM = 64
+
+
+############################################################
+#### One RGB pixel per cell: ward colors with walls on top
+############################################################
+def rasterize(grid):
+    palette = [ImageColor.getrgb(DEFAULT_COLOR)]
+    lookup = bytearray(256)
+    for ward, color in WARD_COLORS.items():
+        lookup[ord(ward)] = len(palette)
+        palette.append(ImageColor.getrgb(color))
+
+    size = (grid.cols, grid.rows)
+    image = Image.frombytes('P', size, bytes(grid.wards).translate(bytes(lookup)))
+    image.putpalette([channel for color in palette for channel in color])
+    image = image.convert('RGB')
+
+    wall_mask = Image.frombytes('L', size, bytes(grid.walls).translate(bytes([0, 255]) + bytes(254)))
+    image.paste(ImageColor.getrgb(WALL_COLOR), (0, 0) + size, wall_mask)
+    return image
+
+
+class MapRenderer:
+    def __init__(self, canvas, grid, cell_size=25):
+        self.canvas = canvas
+        self.grid = grid
+        self.base = rasterize(grid)
+        #### Pixels per cell, and the map cell at the top-left corner
+        self.zoom = cell_size
+        self.origin_row = 0.0
+        self.origin_col = 0.0
+        self.photo = None
+        self.image_item = canvas.create_image(0, 0, anchor='nw')
+        canvas.tag_lower(self.image_item)
+        self.drag_from = None
+
+        canvas.bind("<ButtonPress-1>", self.start_drag)
+        canvas.bind("<B1-Motion>", self.drag)
+        canvas.bind("<MouseWheel>", self.wheel)
+        canvas.bind("<Button-4>", self.wheel)
+        canvas.bind("<Button-5>", self.wheel)
+        canvas.bind("<Configure>", lambda event: self.redraw())
+
+    ############################################################
+    #### The ward or wall layer changed, e.g. after set_wall
+    ############################################################
+    def refresh(self):
+        self.base = rasterize(self.grid)
+        self.redraw()
+
+    def viewport_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            #### Not mapped yet: use the requested size
+            width = int(self.canvas['width'])
+            height = int(self.canvas['height'])
+        return width, height
+
+    def redraw(self):
+        width, height = self.viewport_size()
+        zoom = self.zoom
+
+        #### Whole cells that overlap the viewport
+        first_col = max(int(math.floor(self.origin_col)), 0)
+        first_row = max(int(math.floor(self.origin_row)), 0)
+        last_col = min(int(math.ceil(self.origin_col + width / zoom)), self.grid.cols)
+        last_row = min(int(math.ceil(self.origin_row + height / zoom)), self.grid.rows)
+        if last_col <= first_col or last_row <= first_row:
+            self.canvas.itemconfigure(self.image_item, image='')
+            return
+
+        visible = self.base.crop((first_col, first_row, last_col, last_row))
+        size = (max(round((last_col - first_col) * zoom), 1), max(round((last_row - first_row) * zoom), 1))
+        if zoom >= 1:
+            visible = visible.resize(size, Image.NEAREST)
+        else:
+            visible = visible.resize(size, Image.BOX)
+
+        self.photo = ImageTk.PhotoImage(visible)
+        self.canvas.itemconfigure(self.image_item, image=self.photo)
+        self.canvas.coords(self.image_item, round((first_col - self.origin_col) * zoom),
+                           round((first_row - self.origin_row) * zoom))
+
+    ############################################################
+    #### Screen rectangle of a cell under the current view
+    ############################################################
+    def cell_box(self, pos):
+        x, y = pos
+        left = (y - self.origin_col) * self.zoom
+        top = (x - self.origin_row) * self.zoom
+        return left, top, left + self.zoom, top + self.zoom
+
+    def draw_cell(self, pos, fill, tags=()):
+        return self.canvas.create_rectangle(*self.cell_box(pos), fill=fill, tags=("overlay",) + tuple(tags))
+
+    def move_cell(self, item, pos):
+        self.canvas.coords(item, *self.cell_box(pos))
+
+    ############################################################
+    #### Pan and zoom. Overlay items are moved and scaled with
+    #### the view instead of being drawn again.
+    ############################################################
+    def pan(self, dx, dy):
+        self.origin_col -= dx / self.zoom
+        self.origin_row -= dy / self.zoom
+        self.canvas.move("overlay", dx, dy)
+        self.redraw()
+
+    def zoom_at(self, factor, x, y):
+        new_zoom = min(max(self.zoom * factor, MIN_ZOOM), MAX_ZOOM)
+        factor = new_zoom / self.zoom
+        self.origin_col += x / self.zoom - x / new_zoom
+        self.origin_row += y / self.zoom - y / new_zoom
+        self.zoom = new_zoom
+        self.canvas.scale("overlay", x, y, factor, factor)
+        self.redraw()
+
+    ############################################################
+    #### Zoom so the whole map fits the viewport
+    ############################################################
+    def fit(self):
+        width, height = self.viewport_size()
+        factor = min(width / self.grid.cols, height / self.grid.rows) / self.zoom
+        self.pan(-self.origin_col * self.zoom, -self.origin_row * self.zoom)
+        self.zoom_at(factor, 0, 0)
+
+    def start_drag(self, event):
+        self.drag_from = (event.x, event.y)
+
+    def drag(self, event):
+        if self.drag_from is not None:
+            self.pan(event.x - self.drag_from[0], event.y - self.drag_from[1])
+            self.drag_from = (event.x, event.y)
+
+    def wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.zoom_at(1.25, event.x, event.y)
+        else:
+            self.zoom_at(0.8, event.x, event.y)
@@ -0,0 +1,384 @@
+#######################################################
+#### Delivery route planning.
+####
+#### Chooses the order in which to visit every goal so the
+#### total number of moves is as small as possible. With
+#### strict priorities, goals in more urgent wards are still
+#### visited before goals in less urgent ones; the order
+#### inside each priority level is free.
+####
+#### plan_weighted_route() instead trades urgency against
+#### travel: it minimizes the priority-weighted sum of the
+#### arrival times at the goals.
+####
+#### Node 0 of a distance matrix is the start, nodes 1..n
+#### are the goals. Routes are lists of goal nodes.
+#######################################################
+from arena import INF
+from distance_cache import distance_field
+
+#### Largest goal count solved exactly with Held-Karp
+EXACT_LIMIT = 12
+
+
+############################################################
+#### Shortest-path moves between every pair of points
+############################################################
+def distance_matrix(grid, points):
+    indexes = [grid.index(point) for point in points]
+    matrix = [[INF] * len(points) for _ in points]
+    for j, target in enumerate(indexes):
+        field = distance_field(grid, target)
+        for i, source in enumerate(indexes):
+            matrix[i][j] = field[source]
+    return matrix
+
+
+def route_cost(matrix, route):
+    cost = 0
+    previous = 0
+    for node in route:
+        cost += matrix[previous][node]
+        previous = node
+    return cost
+
+
+############################################################
+#### Bitmask of the goals that must come before each goal
+############################################################
+def precedence_masks(priorities, strict):
+    masks = [0] * len(priorities)
+    if strict:
+        for node, priority in enumerate(priorities):
+            for other, other_priority in enumerate(priorities):
+                if other_priority > priority:
+                    masks[node] |= 1 << other
+    return masks
+
+
+############################################################
+#### Held-Karp dynamic program over subsets of goals
+############################################################
+def exact_route(matrix, priorities, strict=True):
+    count = len(priorities)
+    if count == 0:
+        return []
+    before = precedence_masks(priorities, strict)
+    full = (1 << count) - 1
+    cost = [[INF] * count for _ in range(1 << count)]
+    last = [[-1] * count for _ in range(1 << count)]
+
+    for goal in range(count):
+        if before[goal] == 0:
+            cost[1 << goal][goal] = matrix[0][goal + 1]
+
+    for mask in range(1, full + 1):
+        for goal in range(count):
+            current = cost[mask][goal]
+            if current == INF:
+                continue
+            for following in range(count):
+                bit = 1 << following
+                if mask & bit or before[following] & ~mask:
+                    continue
+                new_cost = current + matrix[goal + 1][following + 1]
+                if new_cost < cost[mask | bit][following]:
+                    cost[mask | bit][following] = new_cost
+                    last[mask | bit][following] = goal
+
+    goal = min(range(count), key=lambda node: cost[full][node])
+    route = []
+    mask = full
+    while goal != -1:
+        route.append(goal + 1)
+        goal, mask = last[mask][goal], mask & ~(1 << goal)
+    route.reverse()
+    return route
+
+
+############################################################
+#### Nearest neighbor among the goals allowed next
+############################################################
+def greedy_route(matrix, priorities, strict=True):
+    left = set(range(1, len(priorities) + 1))
+    route = []
+    current = 0
+    while left:
+        if strict:
+            top = max(priorities[node - 1] for node in left)
+            candidates = [node for node in left if priorities[node - 1] == top]
+        else:
+            candidates = left
+        current = min(candidates, key=lambda node: (matrix[current][node], node))
+        route.append(current)
+        left.remove(current)
+    return route
+
+
+############################################################
+#### 2-opt and or-opt moves until no move shortens the
+#### route. Only moves that keep the priority order valid
+#### are tried: a reversed segment must lie inside one
+#### priority level, and a moved goal must land between
+#### goals of its own level.
+############################################################
+def improve_route(matrix, route, priorities, strict=True):
+    route = list(route)
+
+    def level(position):
+        return priorities[route[position] - 1]
+
+    def node(position):
+        return route[position] if 0 <= position < len(route) else None
+
+    def distance(a, b):
+        if a is None or b is None:
+            return 0
+        return matrix[a][b]
+
+    improved = True
+    while improved:
+        improved = False
+
+        #### 2-opt: reverse route[i..j]
+        for i in range(len(route) - 1):
+            before = route[i - 1] if i > 0 else 0
+            for j in range(i + 1, len(route)):
+                if strict and level(i) != level(j):
+                    break
+                after = node(j + 1)
+                delta = (distance(before, route[j]) + distance(route[i], after)
+                         - distance(before, route[i]) - distance(route[j], after))
+                if delta < 0:
+                    route[i:j + 1] = reversed(route[i:j + 1])
+                    improved = True
+
+        #### or-opt: move one goal somewhere else
+        for i in range(len(route)):
+            moving = route[i]
+            before = route[i - 1] if i > 0 else 0
+            after = node(i + 1)
+            removed = distance(before, moving) + distance(moving, after) - distance(before, after)
+            rest = route[:i] + route[i + 1:]
+            best_gain = 0
+            best_position = None
+            for position in range(len(rest) + 1):
+                if position == i:
+                    continue
+                left = rest[position - 1] if position > 0 else 0
+                right = rest[position] if position < len(rest) else None
+                if strict:
+                    priority = priorities[moving - 1]
+                    if left != 0 and priorities[left - 1] < priority:
+                        continue
+                    if right is not None and priorities[right - 1] > priority:
+                        continue
+                gain = removed - (distance(left, moving) + distance(moving, right) - distance(left, right))
+                if gain > best_gain:
+                    best_gain = gain
+                    best_position = position
+            if best_position is not None:
+                rest.insert(best_position, moving)
+                route = rest
+                improved = True
+
+    return route
+
+
+############################################################
+#### Best visiting order for the goals that can be reached.
+#### Returns (route, cost) where route holds goal nodes.
+#### Goals unreachable from the start are left out.
+############################################################
+def plan_route(matrix, priorities, strict=True):
+    reachable = [node for node in range(1, len(priorities) + 1) if matrix[0][node] != INF]
+    sub_matrix = [[matrix[a][b] for b in [0] + reachable] for a in [0] + reachable]
+    sub_priorities = [priorities[node - 1] for node in reachable]
+
+    if len(reachable) <= EXACT_LIMIT:
+        route = exact_route(sub_matrix, sub_priorities, strict)
+    else:
+        route = greedy_route(sub_matrix, sub_priorities, strict)
+        route = improve_route(sub_matrix, route, sub_priorities, strict)
+
+    route = [reachable[node - 1] for node in route]
+    return route, route_cost(matrix, route)
+
+
+############################################################
+#### Sum over the goals of weight * moves until arrival
+############################################################
+def weighted_completion(matrix, route, weights):
+    total = 0
+    time = 0
+    previous = 0
+    for node in route:
+        time += matrix[previous][node]
+        total += weights[node - 1] * time
+        previous = node
+    return total
+
+
+############################################################
+#### Exact weighted completion order by dynamic programming
+#### over subsets. Every leg delays all goals not yet
+#### reached, so its cost is its length times their weight,
+#### which depends only on the set already visited.
+############################################################
+def exact_weighted_route(matrix, weights):
+    count = len(weights)
+    if count == 0:
+        return []
+    full = (1 << count) - 1
+    waiting = [0] * (1 << count)
+    for mask in range(1, full + 1):
+        low = mask & -mask
+        waiting[mask] = waiting[mask ^ low] + weights[low.bit_length() - 1]
+    cost = [[INF] * count for _ in range(1 << count)]
+    last = [[-1] * count for _ in range(1 << count)]
+
+    for goal in range(count):
+        cost[1 << goal][goal] = matrix[0][goal + 1] * waiting[full]
+
+    for mask in range(1, full + 1):
+        left = waiting[full ^ mask]
+        for goal in range(count):
+            current = cost[mask][goal]
+            if current == INF:
+                continue
+            for following in range(count):
+                bit = 1 << following
+                if mask & bit:
+                    continue
+                new_cost = current + matrix[goal + 1][following + 1] * left
+                if new_cost < cost[mask | bit][following]:
+                    cost[mask | bit][following] = new_cost
+                    last[mask | bit][following] = goal
+
+    goal = min(range(count), key=lambda node: cost[full][node])
+    route = []
+    mask = full
+    while goal != -1:
+        route.append(goal + 1)
+        goal, mask = last[mask][goal], mask & ~(1 << goal)
+    route.reverse()
+    return route
+
+
+############################################################
+#### Next goal with the most weight per move, as in Smith's
+#### rule for weighted completion times
+############################################################
+def greedy_weighted_route(matrix, weights):
+    left = set(range(1, len(weights) + 1))
+    route = []
+    current = 0
+    while left:
+        current = min(left, key=lambda node: (matrix[current][node] / weights[node - 1], node))
+        route.append(current)
+        left.remove(current)
+    return route
+
+
+############################################################
+#### Arrival time at each position of a route, and the
+#### weight of the goals from each position to the end
+############################################################
+def completion_tables(matrix, route, weights):
+    arrival = []
+    time = 0
+    previous = 0
+    for node in route:
+        time += matrix[previous][node]
+        arrival.append(time)
+        previous = node
+    waiting = [0] * (len(route) + 1)
+    for position in range(len(route) - 1, -1, -1):
+        waiting[position] = waiting[position + 1] + weights[route[position] - 1]
+    return arrival, waiting
+
+
+############################################################
+#### Swap neighbors and move single goals while either
+#### lowers the weighted completion time. A move shifts
+#### whole stretches of the route by the same time, so its
+#### change in cost is found in O(1) from the arrival times
+#### and the weight still waiting behind each position.
+############################################################
+def improve_weighted_route(matrix, route, weights):
+    route = list(route)
+    count = len(route)
+
+    def distance(a, b):
+        if b is None:
+            return 0
+        return matrix[a][b]
+
+    def node(position):
+        return route[position] if position < count else None
+
+    arrival, waiting = completion_tables(matrix, route, weights)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(count - 1):
+            before = route[i - 1] if i > 0 else 0
+            a, b = route[i], route[i + 1]
+            after = node(i + 2)
+            delta = (distance(before, b) - distance(before, a)) * waiting[i] \
+                + matrix[b][a] * (waiting[i + 2] + weights[a - 1]) \
+                - matrix[a][b] * (waiting[i + 2] + weights[b - 1]) \
+                + (distance(a, after) - distance(b, after)) * waiting[i + 2]
+            if delta < 0:
+                route[i], route[i + 1] = b, a
+                arrival, waiting = completion_tables(matrix, route, weights)
+                improved = True
+
+        for i in range(count):
+            moving = route[i]
+            weight = weights[moving - 1]
+            before = route[i - 1] if i > 0 else 0
+            after = node(i + 1)
+            #### Time every later goal saves once moving is taken out
+            saved = distance(before, moving) + distance(moving, after) - distance(before, after)
+            for k in range(count):
+                if k == i:
+                    continue
+                if k > i:
+                    #### Insert after route[k]
+                    left, right = route[k], node(k + 1)
+                    added = distance(left, moving) + distance(moving, right) - distance(left, right)
+                    delta = -saved * (waiting[i + 1] - waiting[k + 1]) + (added - saved) * waiting[k + 1] \
+                        + weight * (arrival[k] - saved + matrix[left][moving] - arrival[i])
+                else:
+                    #### Insert before route[k]
+                    left, right = route[k - 1] if k > 0 else 0, route[k]
+                    added = matrix[left][moving] + matrix[moving][right] - matrix[left][right]
+                    delta = added * (waiting[k] - waiting[i]) + (added - saved) * waiting[i + 1] \
+                        + weight * ((arrival[k - 1] if k > 0 else 0) + matrix[left][moving] - arrival[i])
+                if delta < 0:
+                    route.pop(i)
+                    route.insert(k, moving)
+                    arrival, waiting = completion_tables(matrix, route, weights)
+                    improved = True
+                    break
+    return route
+
+
+############################################################
+#### Order of the reachable goals with the smallest sum of
+#### weight * arrival time. Returns (route, objective).
+############################################################
+def plan_weighted_route(matrix, weights):
+    reachable = [node for node in range(1, len(weights) + 1) if matrix[0][node] != INF]
+    sub_matrix = [[matrix[a][b] for b in [0] + reachable] for a in [0] + reachable]
+    sub_weights = [weights[node - 1] for node in reachable]
+
+    if len(reachable) <= EXACT_LIMIT:
+        route = exact_weighted_route(sub_matrix, sub_weights)
+    else:
+        route = greedy_weighted_route(sub_matrix, sub_weights)
+        route = improve_weighted_route(sub_matrix, route, sub_weights)
+
+    route = [reachable[node - 1] for node in route]
+    return route, weighted_completion(matrix, route, weights)
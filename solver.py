@@ -0,0 +1,457 @@
+#######################################################
+#### Headless delivery solver.
+####
+#### Pure pathfinding core shared by the Tk GUI and the
+#### batch command line. Nothing in here imports tkinter
+#### or PIL, so it can run on machines without a display.
+#######################################################
+import argparse
+import json
+import re
+import sys
+import time
+
+from dial import dial_search
+from distance_cache import DistanceCache, follow_gradient
+from dstar import DStarLite
+from engines import astar, bidirectional, jump_point_search, manhattan
+from grid import Grid
+from hierarchy import hierarchical_search
+from landmarks import landmark_table
+from mapfile import load_map
+from multi_agent import CooperativePlanner
+from path_cache import MAX_ENTRIES, MISS, PathCache
+from routing import distance_matrix, plan_route, plan_weighted_route
+from stats import RunStats, SearchStats, write_json_lines
+from tracing import enable as enable_tracing, profile, span, write_trace
+from hospital_map import maze, floor_plan
+
+#### Search engine behind each delivery algorithm name
+ENGINES = {
+    "astar": astar,
+    "alt": astar,
+    "dijkstra": dial_search,
+    "jps": jump_point_search,
+    "hierarchical": hierarchical_search,
+    "bidirectional-astar": bidirectional,
+    "bidirectional-dijkstra": bidirectional,
+}
+ALGORITHMS = tuple(ENGINES)
+
+#### How the visiting order of the delivery locations is chosen
+ROUTES = ("greedy", "optimized", "weighted")
+
+#### Algorithms that are guided by the Manhattan heuristic
+INFORMED = ("astar", "jps", "bidirectional-astar")
+
+
+############################################################
+#### Read a delivery job: algorithm, start and goal list
+############################################################
+def parse_input_file(file_path):
+    with span("parse_input_file", file=file_path):
+        with open(file_path, 'r') as file:
+            return parse_job(file.read())
+
+
+############################################################
+#### Same as parse_input_file, for job text already in memory
+############################################################
+def parse_job(text):
+    # Turn everything to lower case
+    lines = [line.strip().lower() for line in text.splitlines()]
+
+    # Check if the file is 3 lines long
+    if len(lines) < 3:
+        raise ValueError("Error: Input file length must be 3 lines")
+
+    # Check if the first line contains the delivery algorithm
+    if not any(lines[0] == "delivery algorithm: " + alg for alg in ALGORITHMS):
+        raise ValueError("Error: First line should specify the delivery algorithm")
+
+    # Check if the second line contains the start location
+    if not lines[1].startswith("start location:"):
+        raise ValueError("Error: Second line should specify the start location")
+
+    # Check if the third line contains delivery locations
+    if not lines[2].startswith("delivery locations:"):
+        raise ValueError("Error: Third line should specify the delivery locations")
+
+    # Get algorithm
+    alg = lines[0].split(":")[1].strip()
+
+    # Get start position using regular expression
+    start_match = re.match(r'start location:\s*\((\d+),\s*(\d+)\)', lines[1])
+    if not start_match:
+        raise ValueError("Start location format is incorrect")
+    start_pos = tuple(map(int, start_match.groups()))
+
+    # Get delivery locations using regular expression
+    delivery_match = re.findall(r'\((\d+),\s*(\d+)\)', lines[2])
+    if not delivery_match:
+        raise ValueError("Delivery locations format is incorrect")
+    goal_pos_list = [(int(x), int(y)) for x, y in delivery_match]
+
+    return alg, start_pos, goal_pos_list
+
+
+############################################################
+#### Outcome of one delivery job
+############################################################
+class DeliveryResult:
+    def __init__(self, alg, start):
+        self.alg = alg
+        self.start = start
+        #### Goals in the order they were attempted
+        self.order = []
+        #### One path per attempted goal, None when unreachable
+        self.paths = []
+        self.success_goals = []
+        self.expanded = 0
+        self.elapsed = 0.0
+        #### Sum of ward weight * moves until arrival over delivered goals
+        self.weighted_completion = 0
+        #### One SearchStats per attempted goal, and their totals
+        self.searches = []
+        self.stats = RunStats()
+
+    @property
+    def success(self):
+        return len(self.success_goals) > 0
+
+    @property
+    def moves(self):
+        return sum(len(path) - 1 for path in self.paths if path)
+
+    def to_dict(self):
+        return {
+            "alg": self.alg,
+            "start": list(self.start),
+            "order": [list(goal) for goal in self.order],
+            "paths": [[list(pos) for pos in path] if path else None for path in self.paths],
+            "success_goals": [list(goal) for goal in self.success_goals],
+            "success": self.success,
+            "expanded": self.expanded,
+            "elapsed": self.elapsed,
+            "weighted_completion": self.weighted_completion,
+            "stats": self.stats.to_dict(),
+        }
+
+
+############################################################
+#### Solver over a walls matrix and a ward overlay
+############################################################
+class DeliverySolver:
+    def __init__(self, maze, wards, cache_dir=None, path_cache_size=MAX_ENTRIES):
+        with span("build_grid"):
+            grid = Grid.from_matrices(maze, wards)
+        self.setup(grid, cache_dir, path_cache_size)
+
+    ############################################################
+    #### Solver over an existing grid, e.g. a compiled map file
+    ############################################################
+    @classmethod
+    def from_grid(cls, grid, cache_dir=None, path_cache_size=MAX_ENTRIES):
+        solver = cls.__new__(cls)
+        solver.setup(grid, cache_dir, path_cache_size)
+        return solver
+
+    @classmethod
+    def from_map_file(cls, map_path, cache_dir=None, path_cache_size=MAX_ENTRIES):
+        with span("load_map", file=map_path):
+            grid = load_map(map_path)
+        return cls.from_grid(grid, cache_dir, path_cache_size)
+
+    def setup(self, grid, cache_dir, path_cache_size=MAX_ENTRIES):
+        self.grid = grid
+        self.rows = grid.rows
+        self.cols = grid.cols
+        #### Saved distance fields for frequent destinations
+        self.distance_cache = DistanceCache(grid, cache_dir) if cache_dir else None
+        #### Recent legs by (start, goal, alg, grid version); 0 turns it off
+        self.path_cache = PathCache(path_cache_size) if path_cache_size else None
+
+    def in_bounds(self, pos):
+        return self.grid.in_bounds(pos)
+
+    def is_wall(self, pos):
+        return self.grid.is_wall(pos)
+
+    def ward(self, pos):
+        return self.grid.ward(pos) if self.grid.in_bounds(pos) else None
+
+    def priority(self, pos):
+        return self.grid.priority(pos) if self.grid.in_bounds(pos) else -1
+
+    ############################################################
+    #### Heuristic for a goal cell index, None for Dijkstra.
+    #### alt uses landmark distances on top of Manhattan.
+    ############################################################
+    def heuristic(self, goal, alg):
+        if alg == "alt":
+            with span("landmarks"):
+                table = landmark_table(self.grid)
+            return table.heuristic(goal, self.grid)
+        if alg in INFORMED:
+            # A Star uses heuristics and actual path cost
+            return manhattan(self.grid, goal)
+        else:
+            # Dijkstra uses just actual path cost so heuristics should be 0
+            return None
+
+    ############################################################
+    #### Search from start to goal with the engine behind alg.
+    #### Returns (path, expanded): the list of positions from
+    #### start to goal, or None when the goal cannot be reached,
+    #### and the number of expanded cells. A SearchStats passed
+    #### as stats is filled in with the search counters. Legs
+    #### already in the path cache are returned without a search.
+    ############################################################
+    def search(self, start, goal, alg="astar", stats=None):
+        started = time.perf_counter_ns()
+        key = (tuple(start), tuple(goal), alg, self.grid.version)
+        path = MISS
+        if self.path_cache is not None:
+            self.path_cache.sync(self.grid.version)
+            path = self.path_cache.get(key)
+        if path is not MISS:
+            expanded = 0
+            if stats is not None:
+                stats.path_cached = True
+        else:
+            with span("find_path", alg=alg, start=start, goal=goal):
+                path, expanded = self.run_search(start, goal, alg, stats)
+            if self.path_cache is not None:
+                self.path_cache.put(key, path)
+        if stats is not None:
+            stats.found(path)
+            stats.elapsed_ns = time.perf_counter_ns() - started
+        return path, expanded
+
+    def run_search(self, start, goal, alg, stats):
+        grid = self.grid
+        if not grid.in_bounds(start) or not grid.in_bounds(goal) or grid.is_wall(start) or grid.is_wall(goal):
+            return None, 0
+
+        goal_index = grid.index(goal)
+
+        #### A cached destination needs no search at all
+        if self.distance_cache is not None:
+            field = self.distance_cache.field(goal_index)
+            if field is not None:
+                path = follow_gradient(grid, field, grid.index(start))
+                if stats is not None:
+                    stats.cached = True
+                return (grid.positions(path) if path else None), 0
+
+        engine = ENGINES[alg]
+        with span("engine", alg=alg):
+            path, expanded = engine(grid, grid.index(start), goal_index, self.heuristic(goal_index, alg), stats)
+        if path is None:
+            return None, expanded
+        with span("reconstruct_path", cells=len(path)):
+            return grid.positions(path), expanded
+
+    def find_path(self, start, goal, alg="astar"):
+        return self.search(start, goal, alg)[0]
+
+    ############################################################
+    #### Dynamic map: block or reopen a cell mid-shift. Cached
+    #### distance fields notice the new grid version and
+    #### rebuild themselves; ward clusters rebuild only the
+    #### tiles the edit touched.
+    ############################################################
+    def set_wall(self, pos, wall=True):
+        return self.grid.set_wall(pos, wall)
+
+    ############################################################
+    #### D* Lite planner for one leg that can be repaired after
+    #### set_wall instead of searched again from scratch
+    ############################################################
+    def replanner(self, start, goal):
+        return DStarLite(self.grid, start, goal)
+
+    ############################################################
+    #### Collision-free schedules for several robots, each given
+    #### as (start, [goal, ...]); see multi_agent.py
+    ############################################################
+    def plan_robots(self, robots):
+        return CooperativePlanner(self.grid).plan(robots)
+
+    ############################################################
+    #### Greedy choice: a goal in the agent's current ward if
+    #### there is any, otherwise the goal with the highest ward
+    #### priority.
+    ############################################################
+    def greedy_next(self, agent_pos, goals_left):
+        # check list of goals left to see if any are in the same ward first
+        for goal in goals_left:
+            if self.ward(goal) == self.ward(agent_pos):
+                return goal
+
+        # no goal in this ward, take the most urgent one still left
+        return min(goals_left, key=lambda goal: (-self.priority(goal), goal))
+
+    ############################################################
+    #### Visiting order with the fewest total moves that still
+    #### serves more urgent wards first. Unreachable goals go
+    #### last so they are still attempted and reported.
+    ############################################################
+    def plan_route(self, start, goals, strict=True):
+        valid = [goal for goal in goals if self.in_bounds(goal) and not self.is_wall(goal)]
+        if not self.in_bounds(start) or self.is_wall(start):
+            return list(goals)
+        matrix = distance_matrix(self.grid, [start] + valid)
+        route, _ = plan_route(matrix, [self.priority(goal) for goal in valid], strict)
+        order = [valid[node - 1] for node in route]
+        return order + [goal for goal in goals if goal not in order]
+
+    ############################################################
+    #### Weight of a delivery in the weighted completion time:
+    #### its ward priority, at least 1 outside the wards
+    ############################################################
+    def weight(self, goal):
+        return max(self.priority(goal), 1)
+
+    ############################################################
+    #### Visiting order with the smallest sum of weight times
+    #### arrival time, so urgent goals are not held up by long
+    #### trips and short detours to them pay off. Returns
+    #### (order, objective); unreachable goals go last.
+    ############################################################
+    def plan_weighted_route(self, start, goals):
+        valid = [goal for goal in goals if self.in_bounds(goal) and not self.is_wall(goal)]
+        if not self.in_bounds(start) or self.is_wall(start):
+            return list(goals), 0
+        matrix = distance_matrix(self.grid, [start] + valid)
+        route, objective = plan_weighted_route(matrix, [self.weight(goal) for goal in valid])
+        order = [valid[node - 1] for node in route]
+        return order + [goal for goal in goals if goal not in order], objective
+
+    ############################################################
+    #### Visit every goal. route="greedy" picks each next goal
+    #### as the agent goes; route="optimized" plans the whole
+    #### order up front with plan_route, and route="weighted"
+    #### with plan_weighted_route. Every result reports its
+    #### weighted completion time for comparison.
+    ############################################################
+    def solve(self, alg, start, goals, route="greedy"):
+        with span("solve", alg=alg, goals=len(goals), route=route):
+            return self.solve_goals(alg, start, goals, route)
+
+    def solve_goals(self, alg, start, goals, route):
+        result = DeliveryResult(alg, start)
+        started = time.perf_counter()
+
+        goals_left = list(dict.fromkeys(goals))
+        planned = None
+        if route == "optimized":
+            with span("plan_route", goals=len(goals_left)):
+                planned = self.plan_route(start, goals_left)
+        elif route == "weighted":
+            with span("plan_weighted_route", goals=len(goals_left)):
+                planned, _ = self.plan_weighted_route(start, goals_left)
+
+        agent_pos = start
+        arrival = 0
+        while goals_left:
+            if planned:
+                goal_pos = planned[len(result.order)]
+            else:
+                goal_pos = self.greedy_next(agent_pos, goals_left)
+
+            stats = SearchStats(alg, agent_pos, goal_pos)
+            path, expanded = self.search(agent_pos, goal_pos, alg, stats)
+            goals_left.remove(goal_pos)
+            result.order.append(goal_pos)
+            result.paths.append(path)
+            result.expanded += expanded
+            result.searches.append(stats)
+            result.stats.add(stats)
+
+            #### The agent only moves when the goal was reached
+            if path is not None:
+                result.success_goals.append(goal_pos)
+                agent_pos = goal_pos
+                arrival += len(path) - 1
+                result.weighted_completion += self.weight(goal_pos) * arrival
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def solve_file(self, file_path, route="greedy"):
+        alg, start, goals = parse_input_file(file_path)
+        return self.solve(alg, start, goals, route)
+
+
+def load_solver(map_path=None, cache_dir=None, path_cache_size=MAX_ENTRIES):
+    if map_path:
+        return DeliverySolver.from_map_file(map_path, cache_dir, path_cache_size)
+    return DeliverySolver(maze, floor_plan, cache_dir, path_cache_size)
+
+
+############################################################
+#### Batch command line: many job files, one process
+############################################################
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve delivery jobs without the GUI.")
+    parser.add_argument("--headless", action="store_true",
+                        help="accepted for compatibility with AStar.py; the solver never opens a window")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="save distance fields for frequent destinations under DIR")
+    parser.add_argument("--route", choices=ROUTES, default="greedy",
+                        help="how to order the delivery locations (default: greedy)")
+    parser.add_argument("--map", metavar="FILE", help="compiled map file (default: the bundled hospital map)")
+    parser.add_argument("--path-cache", type=int, default=MAX_ENTRIES, metavar="N",
+                        help=f"remember the last N legs, 0 to turn off (default: {MAX_ENTRIES})")
+    parser.add_argument("--stats", metavar="FILE",
+                        help="append per-search and per-run statistics to FILE as JSON lines")
+    parser.add_argument("--trace", metavar="FILE", help="write a Chrome trace-event JSON file of the run phases")
+    parser.add_argument("--profile", metavar="FILE", help="cProfile the first job file and save the stats to FILE")
+    parser.add_argument("input_files", nargs="+", help="delivery job files")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        enable_tracing()
+    solver = load_solver(args.map, args.cache_dir, args.path_cache)
+    stats_output = open(args.stats, 'a') if args.stats else None
+    status = 0
+    try:
+        for number, file_path in enumerate(args.input_files):
+            if number == 0 and args.profile:
+                with profile(args.profile):
+                    status |= solve_and_report(solver, file_path, args.route, stats_output)
+            else:
+                status |= solve_and_report(solver, file_path, args.route, stats_output)
+    finally:
+        if stats_output is not None:
+            if solver.path_cache is not None:
+                stats_output.write(json.dumps(dict(type="path_cache", **solver.path_cache.to_dict())) + "\n")
+            stats_output.close()
+        if args.trace:
+            write_trace(args.trace)
+    return status
+
+
+############################################################
+#### Solve one job file for main(); returns its exit status
+############################################################
+def solve_and_report(solver, file_path, route, stats_output):
+    try:
+        with span("job", file=file_path):
+            result = solver.solve_file(file_path, route)
+    except (OSError, ValueError) as error:
+        print(f"{file_path}: {error}", file=sys.stderr)
+        return 1
+
+    print(f"{file_path}: {result.alg} from {result.start}, order {result.order}, "
+          f"{len(result.success_goals)}/{len(result.order)} delivered in {result.moves} moves, "
+          f"{result.expanded} cells expanded, weighted completion {result.weighted_completion} "
+          f"({result.elapsed * 1000:.2f} ms)")
+    if stats_output is not None:
+        write_json_lines(stats_output, result.searches, result.stats, file=file_path)
+    return 0 if result.success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#######################################################
+#### Search instrumentation records.
+####
+#### Engines fill a SearchStats with their open-list
+#### counters when one is passed as stats=. The solver adds
+#### the path, its cost and the elapsed time, and sums every
+#### search of a delivery run into a RunStats. Both turn
+#### into flat dicts, one JSON line each, for dashboards.
+#######################################################
+import json
+
+
+class SearchStats:
+    def __init__(self, alg=None, start=None, goal=None):
+        self.alg = alg
+        self.start = start
+        self.goal = goal
+        self.expanded = 0
+        self.heap_pushes = 0
+        #### Entries popped for a cell that was already settled
+        self.stale_pops = 0
+        self.peak_open = 0
+        #### Cells on the path including both ends, 0 when unreachable
+        self.path_length = 0
+        self.cost = None
+        self.elapsed_ns = 0
+        #### Answered from a saved distance field instead of a search
+        self.cached = False
+        #### Answered from the in-memory path cache
+        self.path_cached = False
+
+    ############################################################
+    #### Open-list counters, called by an engine when it stops
+    ############################################################
+    def count(self, expanded, heap_pushes, stale_pops, peak_open):
+        self.expanded = expanded
+        self.heap_pushes = heap_pushes
+        self.stale_pops = stale_pops
+        self.peak_open = peak_open
+
+    def found(self, path):
+        if path:
+            self.path_length = len(path)
+            self.cost = len(path) - 1
+
+    def to_dict(self):
+        return {
+            "type": "search",
+            "alg": self.alg,
+            "start": list(self.start) if self.start is not None else None,
+            "goal": list(self.goal) if self.goal is not None else None,
+            "expanded": self.expanded,
+            "heap_pushes": self.heap_pushes,
+            "stale_pops": self.stale_pops,
+            "peak_open": self.peak_open,
+            "path_length": self.path_length,
+            "cost": self.cost,
+            "elapsed_ns": self.elapsed_ns,
+            "cached": self.cached,
+            "path_cached": self.path_cached,
+        }
+
+
+############################################################
+#### Totals over the searches of one delivery run
+############################################################
+class RunStats:
+    def __init__(self):
+        self.searches = 0
+        self.found = 0
+        self.cached = 0
+        self.path_cached = 0
+        self.expanded = 0
+        self.heap_pushes = 0
+        self.stale_pops = 0
+        #### Largest open list of any single search
+        self.peak_open = 0
+        self.path_length = 0
+        self.cost = 0
+        self.elapsed_ns = 0
+
+    def add(self, stats):
+        self.searches += 1
+        self.cached += stats.cached
+        self.path_cached += stats.path_cached
+        self.expanded += stats.expanded
+        self.heap_pushes += stats.heap_pushes
+        self.stale_pops += stats.stale_pops
+        self.peak_open = max(self.peak_open, stats.peak_open)
+        self.elapsed_ns += stats.elapsed_ns
+        if stats.cost is not None:
+            self.found += 1
+            self.path_length += stats.path_length
+            self.cost += stats.cost
+
+    def to_dict(self):
+        return {
+            "type": "run",
+            "searches": self.searches,
+            "found": self.found,
+            "cached": self.cached,
+            "path_cached": self.path_cached,
+            "expanded": self.expanded,
+            "heap_pushes": self.heap_pushes,
+            "stale_pops": self.stale_pops,
+            "peak_open": self.peak_open,
+            "path_length": self.path_length,
+            "cost": self.cost,
+            "elapsed_ns": self.elapsed_ns,
+        }
+
+
+############################################################
+#### One JSON line per search, then the run totals. extra
+#### fields (e.g. the job file) are added to every line.
+############################################################
+def write_json_lines(output, searches, totals, **extra):
+    for record in [stats.to_dict() for stats in searches] + [totals.to_dict()]:
+        record.update(extra)
+        output.write(json.dumps(record) + "\n")
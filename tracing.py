@@ -0,0 +1,103 @@
+#######################################################
+#### Opt-in phase tracing and profiling.
+####
+#### Code marks its phases with
+####
+####     with span("search", goal=goal):
+####         ...
+####
+#### which does nothing until enable() is called. Once
+#### enabled, every span is kept as a Chrome trace event, and
+#### write_trace() saves them in the trace-event JSON format
+#### that chrome://tracing and Perfetto load. profile() wraps
+#### a block in cProfile and saves the pstats file.
+#######################################################
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+#### Shared do-nothing span for when tracing is off
+_NO_SPAN = nullcontext()
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.lock = threading.Lock()
+        #### Trace timestamps are microseconds since enable()
+        self.origin = time.perf_counter_ns()
+
+    def enable(self):
+        self.enabled = True
+        self.events = []
+        self.origin = time.perf_counter_ns()
+
+    def disable(self):
+        self.enabled = False
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NO_SPAN
+        return self.record(name, args)
+
+    @contextmanager
+    def record(self, name, args):
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": (started - self.origin) / 1000,
+                "dur": (ended - started) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            with self.lock:
+                self.events.append(event)
+
+    def write(self, file_path):
+        with self.lock:
+            events = list(self.events)
+        with open(file_path, 'w') as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return len(events)
+
+
+#### Process-wide tracer used by span()
+tracer = Tracer()
+
+
+def span(name, **args):
+    return tracer.span(name, **args)
+
+
+def enable():
+    tracer.enable()
+
+
+def write_trace(file_path):
+    return tracer.write(file_path)
+
+
+############################################################
+#### Run a block under cProfile and save the statistics,
+#### readable with python -m pstats
+############################################################
+@contextmanager
+def profile(file_path):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(file_path)